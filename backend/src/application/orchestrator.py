@@ -231,15 +231,17 @@ class CareerCoachOrchestrator:
             job_title=job.get_display_title(),
         )
 
-        # Convert questions by category to DTO
+        # Convert each question once; the category view reuses the same DTOs
+        question_dtos = [self._question_to_dto(q) for q in interview_prep.questions]
+        dto_by_question = dict(zip(map(id, interview_prep.questions), question_dtos))
         questions_by_category_dto = {
-            cat: [self._question_to_dto(q) for q in qs]
+            cat: [dto_by_question[id(q)] for q in qs]
             for cat, qs in interview_prep.questions_by_category.items()
         }
 
         return {
             "job_title": job.get_display_title(),
-            "questions": [self._question_to_dto(q) for q in interview_prep.questions],
+            "questions": question_dtos,
             # Enhanced fields
             "questions_by_category": questions_by_category_dto,
             "preparation_tips": list(interview_prep.preparation_tips),
@@ -55,6 +55,15 @@ LEARNING_PATHS: dict[str, dict[str, Any]] = {
 TIER_ORDER = {"foundational": 1, "intermediate": 2, "advanced": 3}
 
 
+def _to_str_list(value: Any) -> list[str]:
+    """Coerce an LLM-provided list of strings; a bare string becomes one item, anything else is dropped."""
+    if isinstance(value, str):
+        return [value] if value else []
+    if isinstance(value, (list, tuple)):
+        return [str(item) for item in value if item is not None]
+    return []
+
+
 class GenerateCoachingTipsUseCase:
     """Use case for generating career coaching tips with enhanced gap analysis."""
 
@@ -130,16 +139,17 @@ class GenerateCoachingTipsUseCase:
             if not isinstance(t, dict):
                 continue
 
-            title = t.get("title", "")
+            title = t.get("title")
             if not title:
                 continue
 
+            # Null-safe coercion of LLM fields
             tips.append(CoachingTip(
-                category=t.get("category", "general"),
-                title=title,
-                description=t.get("description", ""),
-                action_items=t.get("action_items", []),
-                priority=t.get("priority", "medium"),
+                category=str(t.get("category") or "general"),
+                title=str(title),
+                description=str(t.get("description") or ""),
+                action_items=_to_str_list(t.get("action_items")),
+                priority=str(t.get("priority") or "medium"),
             ))
 
         return tips
@@ -1,12 +1,116 @@
 """Generate Interview Prep Use Case."""
 
+import re
 from typing import Any, Optional
-from collections import defaultdict
 
 from src.domain.entities.analysis_result import InterviewQuestion, InterviewPrep, StarMethod
 from src.infrastructure.llm import OpenAIGateway
 
 
+# Keywords that drive angle selection, matched in a single scan of the question
+ANGLE_KEYWORDS = {
+    "weakness": "weakness",
+    "improve": "weakness",
+    "why": "why",
+    "company": "company_or_role",
+    "role": "company_or_role",
+    "tell me about yourself": "about_yourself",
+}
+ANGLE_KEYWORD_PATTERN = re.compile(
+    "|".join(re.escape(kw) for kw in sorted(ANGLE_KEYWORDS, key=len, reverse=True))
+)
+
+# Role keywords in job titles that add extra preparation tips
+ROLE_TIP_PATTERN = re.compile(r"manager|architect")
+
+# Approach angles returned by _generate_your_angle
+ANGLE_BEHAVIORAL = (
+    "Use the STAR method to structure your answer. Choose a specific example "
+    "from your experience that demonstrates the skill being asked about. "
+    "Focus on YOUR actions and quantify the results if possible."
+)
+ANGLE_TECHNICAL = (
+    "Start with the fundamentals and build up to complexity. If you're unsure, "
+    "think out loud and show your problem-solving process. It's okay to ask "
+    "clarifying questions before diving into the solution."
+)
+ANGLE_WEAKNESS = (
+    "Choose a real weakness but one you're actively working to improve. "
+    "Focus on the steps you've taken to address it and show self-awareness. "
+    "Avoid cliche answers like 'I'm a perfectionist'."
+)
+ANGLE_WHY_COMPANY = (
+    "Show you've done your research. Reference specific aspects of the company, "
+    "product, or role that genuinely interest you. Connect your career goals "
+    "to what this opportunity offers."
+)
+ANGLE_ABOUT_YOURSELF = (
+    "Keep it to 2-3 minutes. Structure as: current role, key achievements, "
+    "why you're interested in this opportunity. Make it a story, not a resume recitation."
+)
+ANGLE_DEFAULT = (
+    "Be specific and use concrete examples. Structure your answer clearly "
+    "and stay focused on what's most relevant to the question."
+)
+
+# STAR guidance themes keyed by the question keywords that select them
+STAR_KEYWORDS = {
+    "conflict": "conflict",
+    "disagree": "conflict",
+    "failure": "failure",
+    "mistake": "failure",
+    "lead": "leadership",
+    "team": "leadership",
+    "challenge": "challenge",
+    "difficult": "challenge",
+}
+STAR_KEYWORD_PATTERN = re.compile("|".join(re.escape(kw) for kw in STAR_KEYWORDS))
+STAR_THEME_PRIORITY = ("conflict", "failure", "leadership", "challenge")
+
+# StarMethod is frozen, so a single instance per theme is shared across questions
+STAR_GUIDANCE = {
+    "conflict": StarMethod(
+        situation="Describe a specific professional disagreement or conflict (keep it professional, not personal)",
+        task="Explain your role and what needed to be resolved",
+        action="Detail how YOU approached the situation - focus on communication, compromise, and professionalism",
+        result="Share the outcome, what you learned, and how you'd handle it differently if needed",
+    ),
+    "failure": StarMethod(
+        situation="Choose a real failure but not something catastrophic",
+        task="Explain what you were trying to accomplish",
+        action="Describe what went wrong and take ownership without blaming others",
+        result="Focus on what you learned and how you've applied that lesson since",
+    ),
+    "leadership": StarMethod(
+        situation="Set the context - team size, project type, and timeline",
+        task="Explain your leadership responsibilities and goals",
+        action="Describe specific leadership actions: delegation, motivation, conflict resolution",
+        result="Quantify the outcome: project success, team growth, metrics improved",
+    ),
+    "challenge": StarMethod(
+        situation="Describe a genuinely challenging situation (technical or interpersonal)",
+        task="Explain why it was challenging and what was at stake",
+        action="Detail your problem-solving approach step by step",
+        result="Share the outcome and what made your approach effective",
+    ),
+}
+STAR_DEFAULT = StarMethod(
+    situation="Set the scene briefly - when, where, who was involved",
+    task="Explain your specific responsibility or goal",
+    action="Describe what YOU did (use 'I' not 'we') with specific details",
+    result="Quantify the outcome if possible - numbers, percentages, time saved",
+)
+
+
+def _to_str_list(value: Any) -> list[str]:
+    """Coerce an LLM-provided list of strings; a bare string becomes one item, anything else is dropped."""
+    if isinstance(value, str):
+        return [value] if value else []
+    if isinstance(value, (list, tuple)):
+        return [str(item) for item in value if item is not None]
+    return []
+
+
 class GenerateInterviewPrepUseCase:
     """Use case for generating comprehensive interview preparation."""
 
@@ -140,9 +244,6 @@ class GenerateInterviewPrepUseCase:
         # Parse and enhance questions
         questions = self._parse_questions(questions_data, resume_summary, skill_gaps)
 
-        # Organize questions by category
-        questions_by_category = self._organize_by_category(questions)
-
         # Select preparation tips with seniority context
         preparation_tips = self._get_preparation_tips(skill_gaps, job_title, detected_seniority)
 
@@ -151,7 +252,6 @@ class GenerateInterviewPrepUseCase:
 
         return InterviewPrep(
             questions=questions,
-            questions_by_category=questions_by_category,
             preparation_tips=preparation_tips,
             questions_to_ask_interviewer=questions_to_ask,
         )
@@ -168,11 +268,12 @@ class GenerateInterviewPrepUseCase:
             if not isinstance(q, dict):
                 continue
 
-            question_text = q.get("question", "")
+            question_text = q.get("question")
             if not question_text:
                 continue
+            question_text = str(question_text)
 
-            category = q.get("category", "general").lower()
+            category = str(q.get("category") or "general").lower()
 
             # Generate your_angle based on the question and resume
             your_angle = self._generate_your_angle(question_text, category, resume_summary)
@@ -182,12 +283,13 @@ class GenerateInterviewPrepUseCase:
             if category == "behavioral":
                 star_guidance = self._generate_star_guidance(question_text)
 
+            # LLM fields may be null or the wrong type
             questions.append(InterviewQuestion(
                 question=question_text,
                 category=category,
-                why_asked=q.get("why_asked", ""),
-                what_to_say=q.get("what_to_say", []),
-                what_to_avoid=q.get("what_to_avoid", []),
+                why_asked=str(q.get("why_asked") or ""),
+                what_to_say=_to_str_list(q.get("what_to_say")),
+                what_to_avoid=_to_str_list(q.get("what_to_avoid")),
                 your_angle=your_angle,
                 star_guidance=star_guidance,
             ))
@@ -201,108 +303,32 @@ class GenerateInterviewPrepUseCase:
         resume_summary: str,
     ) -> str:
         """Generate approach angle for the question based on candidate's background."""
-        question_lower = question.lower()
+        labels = {
+            ANGLE_KEYWORDS[kw] for kw in ANGLE_KEYWORD_PATTERN.findall(question.lower())
+        }
 
         if category == "behavioral":
-            return (
-                "Use the STAR method to structure your answer. Choose a specific example "
-                "from your experience that demonstrates the skill being asked about. "
-                "Focus on YOUR actions and quantify the results if possible."
-            )
+            return ANGLE_BEHAVIORAL
         elif category == "technical":
-            return (
-                "Start with the fundamentals and build up to complexity. If you're unsure, "
-                "think out loud and show your problem-solving process. It's okay to ask "
-                "clarifying questions before diving into the solution."
-            )
-        elif "weakness" in question_lower or "improve" in question_lower:
-            return (
-                "Choose a real weakness but one you're actively working to improve. "
-                "Focus on the steps you've taken to address it and show self-awareness. "
-                "Avoid cliche answers like 'I'm a perfectionist'."
-            )
-        elif "why" in question_lower and ("company" in question_lower or "role" in question_lower):
-            return (
-                "Show you've done your research. Reference specific aspects of the company, "
-                "product, or role that genuinely interest you. Connect your career goals "
-                "to what this opportunity offers."
-            )
-        elif "tell me about yourself" in question_lower:
-            return (
-                "Keep it to 2-3 minutes. Structure as: current role, key achievements, "
-                "why you're interested in this opportunity. Make it a story, not a resume recitation."
-            )
+            return ANGLE_TECHNICAL
+        elif "weakness" in labels:
+            return ANGLE_WEAKNESS
+        elif "why" in labels and "company_or_role" in labels:
+            return ANGLE_WHY_COMPANY
+        elif "about_yourself" in labels:
+            return ANGLE_ABOUT_YOURSELF
         else:
-            return (
-                "Be specific and use concrete examples. Structure your answer clearly "
-                "and stay focused on what's most relevant to the question."
-            )
+            return ANGLE_DEFAULT
 
     def _generate_star_guidance(self, question: str) -> StarMethod:
         """Generate STAR method guidance for behavioral questions."""
-        question_lower = question.lower()
-
-        # Default STAR guidance - can be customized based on question type
-        if "conflict" in question_lower or "disagree" in question_lower:
-            return StarMethod(
-                situation="Describe a specific professional disagreement or conflict (keep it professional, not personal)",
-                task="Explain your role and what needed to be resolved",
-                action="Detail how YOU approached the situation - focus on communication, compromise, and professionalism",
-                result="Share the outcome, what you learned, and how you'd handle it differently if needed",
-            )
-        elif "failure" in question_lower or "mistake" in question_lower:
-            return StarMethod(
-                situation="Choose a real failure but not something catastrophic",
-                task="Explain what you were trying to accomplish",
-                action="Describe what went wrong and take ownership without blaming others",
-                result="Focus on what you learned and how you've applied that lesson since",
-            )
-        elif "lead" in question_lower or "team" in question_lower:
-            return StarMethod(
-                situation="Set the context - team size, project type, and timeline",
-                task="Explain your leadership responsibilities and goals",
-                action="Describe specific leadership actions: delegation, motivation, conflict resolution",
-                result="Quantify the outcome: project success, team growth, metrics improved",
-            )
-        elif "challenge" in question_lower or "difficult" in question_lower:
-            return StarMethod(
-                situation="Describe a genuinely challenging situation (technical or interpersonal)",
-                task="Explain why it was challenging and what was at stake",
-                action="Detail your problem-solving approach step by step",
-                result="Share the outcome and what made your approach effective",
-            )
-        else:
-            return StarMethod(
-                situation="Set the scene briefly - when, where, who was involved",
-                task="Explain your specific responsibility or goal",
-                action="Describe what YOU did (use 'I' not 'we') with specific details",
-                result="Quantify the outcome if possible - numbers, percentages, time saved",
-            )
+        themes = {STAR_KEYWORDS[kw] for kw in STAR_KEYWORD_PATTERN.findall(question.lower())}
 
-    def _organize_by_category(
-        self,
-        questions: list[InterviewQuestion],
-    ) -> dict[str, list[InterviewQuestion]]:
-        """Organize questions by category."""
-        by_category = defaultdict(list)
-
-        for q in questions:
-            category = q.category.lower()
-            # Normalize category names
-            if category in ["screen", "screening"]:
-                category = "screening"
-            elif category in ["tech", "technical", "coding"]:
-                category = "technical"
-            elif category in ["behavior", "behavioral", "soft"]:
-                category = "behavioral"
-            elif category in ["curve", "curveball", "tricky"]:
-                category = "curveball"
-            else:
-                category = "general"
-
-            by_category[category].append(q)
-
-        return dict(by_category)
+        # Themes are checked in priority order - first match wins
+        for theme in STAR_THEME_PRIORITY:
+            if theme in themes:
+                return STAR_GUIDANCE[theme]
+        return STAR_DEFAULT
 
     def _detect_seniority(self, job_title: Optional[str]) -> str:
         """Detect seniority level from job title."""
@@ -363,12 +389,12 @@ class GenerateInterviewPrepUseCase:
 
         # Add role-specific tips
         if job_title:
-            title_lower = job_title.lower()
-            if "manager" in title_lower:
+            role_keywords = set(ROLE_TIP_PATTERN.findall(job_title.lower()))
+            if "manager" in role_keywords:
                 tips.append(
                     "Prepare examples of team building, performance management, and conflict resolution"
                 )
-            if "architect" in title_lower:
+            if "architect" in role_keywords:
                 tips.append(
                     "Prepare to discuss system design decisions, trade-offs, and scalability considerations"
                 )
@@ -1,11 +1,35 @@
 """Parse Job Posting Use Case."""
 
+import re
+import math
 from typing import Any
 
 from src.domain.entities.job_posting import JobPosting, JobRequirement
 from src.infrastructure.llm import OpenAIGateway
 
 
+def _to_int(value: Any) -> int:
+    """Coerce an LLM-provided number (e.g. 3, 3.0, "3-5", "5+ years") to int, defaulting to 0."""
+    if isinstance(value, float) and not math.isfinite(value):
+        return 0  # from_json accepts NaN/Infinity, which int() rejects
+    if isinstance(value, (int, float)):
+        return max(int(value), 0)
+    if isinstance(value, str):
+        # First number in the text; a leading minus is a sign (clamped like numbers), not a range
+        match = re.search(r"-?\d+", value)
+        return max(int(match.group()), 0) if match else 0
+    return 0
+
+
+def _to_bool(value: Any, default: bool = True) -> bool:
+    """Coerce an LLM-provided flag (e.g. true, "false", "no", null) to bool."""
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, str):
+        return value.strip().lower() not in ("false", "no", "0", "")
+    return default if value is None else bool(value)
+
+
 class ParseJobPostingUseCase:
     """Use case for parsing job posting text into structured data."""
 
@@ -39,25 +63,19 @@ class ParseJobPostingUseCase:
             requirements=requirements,
             preferred_skills=preferred_skills,
             keywords=keywords,
-            min_experience_years=int(extracted.get("min_experience_years") or 0),
+            min_experience_years=_to_int(extracted.get("min_experience_years")),
             education_requirements=extracted.get("education_requirements") or [],
         )
 
     def _parse_requirements(self, req_data: list[dict[str, Any]]) -> list[JobRequirement]:
-        """Parse requirements from extracted data."""
-        requirements = []
-        for r in req_data:
-            if not isinstance(r, dict):
-                continue
-
-            skill = r.get("skill", "")
-            if not skill:
-                continue
-
-            requirements.append(JobRequirement(
-                skill=skill,
-                min_years=r.get("min_years"),
-                is_required=r.get("is_required", True),
-            ))
-
-        return requirements
+        """Parse requirements from extracted data, skipping malformed or skill-less rows."""
+        # Coerce LLM types here; the dataclass does not
+        return [
+            JobRequirement(
+                skill=str(skill),
+                min_years=None if (min_years := r.get("min_years")) is None else _to_int(min_years),
+                is_required=_to_bool(r.get("is_required")),
+            )
+            for r in req_data
+            if isinstance(r, dict) and (skill := r.get("skill"))
+        ]
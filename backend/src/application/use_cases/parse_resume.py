@@ -1,8 +1,15 @@
 """Parse Resume Use Case."""
 
 import re
+import math
 import uuid
+import asyncio
+import hashlib
 import logging
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from functools import lru_cache
 from typing import Any, Optional, List
 
 from src.domain.entities.resume import Resume, Skill, Experience, Education, SkillLevel
@@ -11,17 +18,132 @@ from src.domain.knowledge.ats_scoring import KEYWORD_CATEGORIES
 
 logger = logging.getLogger(__name__)
 
-# Known skills for regex fallback extraction
-KNOWN_SKILLS = set()
-for category_data in KEYWORD_CATEGORIES.values():
-    KNOWN_SKILLS.update(skill.lower() for skill in category_data.get("examples", []))
+
+@lru_cache
+def _get_known_skills() -> frozenset[str]:
+    """Known skills for regex fallback extraction (built on first fallback, not at import)."""
+    known_skills = set()
+    for category_data in KEYWORD_CATEGORIES.values():
+        known_skills.update(skill.lower() for skill in category_data.get("examples", []))
+    return frozenset(known_skills)
+
+
+def _build_trie_regex(words: list[str]) -> str:
+    """
+    Build a regex alternation factored as a prefix trie.
+
+    "java|javascript|jenkins" becomes "j(?:ava(?:script)?|enkins)", so the regex
+    engine follows one branch per character instead of retrying every word at
+    each position - DFA-like scanning on top of the stdlib re engine. Optional
+    suffixes are greedy, so the longest word wins at a given position.
+    """
+    trie: dict = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}  # end-of-word marker
+
+    def to_regex(node: dict) -> str:
+        if list(node) == [""]:
+            return ""
+        branches = [re.escape(char) + to_regex(child) for char, child in sorted(node.items()) if char]
+        regex = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if "" in node:
+            regex = "(?:" + regex + ")?"
+        return regex
+
+    return to_regex(trie)
+
+
+@lru_cache
+def _get_skills_pattern() -> re.Pattern:
+    """
+    Single trie-factored alternation of all known skills, so the resume text is
+    scanned once rather than once per skill. Built lazily since the LLM path
+    normally succeeds and never needs it.
+
+    Matches never overlap and the longest skill wins, so "deep learning"
+    consumes its span and shorter skills inside it are not reported again.
+    """
+    # Known skills are lowercase and callers pass lowercased text, so no IGNORECASE
+    return re.compile(r'\b' + _build_trie_regex(sorted(_get_known_skills())) + r'\b')
+
+
+# Remaining regex fallback patterns, compiled once at import instead of on every call
+_YEARS_RE = re.compile(
+    r'(\d+)\+?\s*(?:years?|anos?)\s+(?:of\s+)?(?:experience|experiência)',
+    re.IGNORECASE
+)
+_DATE_RANGE_RE = re.compile(
+    r'(\d{4})\s*[-–]\s*(?:Present|Presente|Atual|(\d{4}))',
+    re.IGNORECASE
+)
+_EMAIL_RE = re.compile(r'[a-z0-9._%+-]+@[a-z0-9.-]+\.[a-z]{2,}')  # matched on lowercased text
+# Leading lookaheads are cheap first-character prefilters: every alternative
+# starts with optional separators, so without them the engine tries each
+# alternative at every offset of the resume
+_PHONE_RE = re.compile(
+    r'(?=[-+.(\s]*\d)(?:'
+    r'\+?55\s*\(?0?\d{2}\)?\s*\d{4,5}[-.\s]?\d{4}'  # BR: +55 (11) 99999-8888
+    r'|\(?0?\d{2}\)?\s*\d{4,5}[-.\s]?\d{4}'  # BR without country code
+    r'|\+?1?[-.\s]?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}'  # US format
+    r')'
+)
+_LINKEDIN_RE = re.compile(r'(?=[hwl])(?:https?://)?(?:www\.)?linkedin\.com/in/[\w-]+')  # matched on lowercased text
+_NAME_RE = re.compile(
+    r'^([A-Z][a-záéíóúàèìòùâêîôûãõç]+(?:\s+[A-Z][a-záéíóúàèìòùâêîôûãõç]+)+)',
+    re.MULTILINE
+)
+_NAME_SEARCH_WINDOW = 500  # names sit in the resume header; don't scan the whole body
+
+
+# Value -> member lookup; avoids SkillLevel(...) raising ValueError for unknown levels
+_SKILL_LEVELS = {level.value: level for level in SkillLevel}
+
+
+def _to_optional_float(value: Any) -> Optional[float]:
+    """Coerce an LLM-provided number to float, or None if it isn't a finite number."""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        number = float(value)
+    elif isinstance(value, str):
+        try:
+            number = float(value)
+        except ValueError:
+            return None
+    else:
+        return None
+    # "nan"/"inf" parse as floats but are not meaningful (and int() rejects them)
+    return number if math.isfinite(number) else None
+
+
+def _to_optional_int(value: Any) -> Optional[int]:
+    """Coerce an LLM-provided number to int, or None if it isn't numeric."""
+    number = _to_optional_float(value)
+    return int(number) if number is not None else None
+
+
+def _to_str_list(value: Any) -> list[str]:
+    """Coerce an LLM-provided list of strings; a bare string becomes one item, anything else is dropped."""
+    if isinstance(value, str):
+        return [value] if value else []
+    if isinstance(value, (list, tuple)):
+        return [str(item) for item in value if item is not None]
+    return []
 
 
 class ParseResumeUseCase:
     """Use case for parsing resume text into structured data."""
 
+    # Max resumes whose regex-fallback skills are remembered (retries/re-parses of the same text)
+    SKILL_CACHE_SIZE = 128
+
     def __init__(self, llm_gateway: OpenAIGateway):
         self.llm_gateway = llm_gateway
+        # blake2b digest of the lowercased text -> extracted skills (Skill is frozen, safe to share)
+        self._skill_cache: OrderedDict[bytes, list[Skill]] = OrderedDict()
+        # Fallbacks run in worker threads, so cache reads/evictions are serialized
+        self._skill_cache_lock = threading.Lock()
 
     async def execute(self, text: str, filename: Optional[str] = None) -> Resume:
         """
@@ -49,24 +171,42 @@ class ParseResumeUseCase:
             logger.warning(f"LLM returned negative experience years ({total_years}), resetting to 0")
             total_years = 0.0
 
+        # P4.2: Contact info from LLM, completed via regex below if missing
+        email = extracted.get("email")
+        phone = extracted.get("phone")
+        linkedin_url = extracted.get("linkedin_url")
+        name = extracted.get("name")
+        location = extracted.get("location")
+
+        # Regex fallbacks are CPU-bound scans over the full text - run the needed ones
+        # in worker threads so they don't block the event loop for other requests
+        fallbacks = {}
+
+        # Skills and contact fallbacks scan lowercased text - build it only if one runs
+        if not skills or not email or not phone:
+            text_lower = text.lower()
+
         # P4.1: Fallback to regex extraction if LLM failed to extract skills
         if not skills:
             logger.warning("LLM failed to extract skills, using regex fallback")
-            skills = self._extract_skills_regex(text)
+            fallbacks["skills"] = asyncio.to_thread(self._extract_skills_regex, text_lower)
 
         # Fallback for experience calculation if LLM returned 0
         if total_years == 0 and text:
-            total_years = self._extract_experience_years_regex(text)
+            fallbacks["years"] = asyncio.to_thread(self._extract_experience_years_regex, text)
 
         # P4.2: Extract contact info via regex if LLM failed
-        email = extracted.get("email")
-        phone = extracted.get("phone")
-        linkedin_url = extracted.get("linkedin_url")
-        name = extracted.get("name")
-        location = extracted.get("location")
-
         if not email or not phone:
-            contact_info = self._extract_contact_regex(text)
+            fallbacks["contact"] = asyncio.to_thread(self._extract_contact_regex, text, text_lower)
+
+        results = dict(zip(fallbacks, await asyncio.gather(*fallbacks.values())))
+
+        if "skills" in results:
+            skills = results["skills"]
+        if "years" in results:
+            total_years = results["years"]
+        if "contact" in results:
+            contact_info = results["contact"]
             if not email:
                 email = contact_info.get("email")
             if not phone:
@@ -92,67 +232,77 @@ class ParseResumeUseCase:
             filename=filename,
         )
 
-    def _extract_skills_regex(self, text: str) -> list[Skill]:
+    def _extract_skills_regex(self, text_lower: str) -> list[Skill]:
         """
         P4.1: Fallback regex extraction for skills when LLM fails.
-        Uses knowledge base of known skills to find matches in resume text.
+        Uses knowledge base of known skills to find matches in the
+        already-lowercased resume text.
         """
-        text_lower = text.lower()
-        found_skills = []
-
-        for skill in KNOWN_SKILLS:
-            # Use word boundary matching to avoid partial matches
-            pattern = rf'\b{re.escape(skill)}\b'
-            if re.search(pattern, text_lower, re.IGNORECASE):
-                found_skills.append(Skill(
-                    name=skill.title() if len(skill) > 3 else skill.upper(),
-                    normalized_name=skill.lower(),
-                    level=SkillLevel.INTERMEDIATE,
-                    years_experience=None,
-                ))
+        text_hash = hashlib.blake2b(text_lower.encode(), digest_size=16).digest()
+        with self._skill_cache_lock:
+            cached = self._skill_cache.get(text_hash)
+            if cached is not None:
+                self._skill_cache.move_to_end(text_hash)
+                return list(cached)
+
+        # Single pass over the text; dict keeps first-seen order and drops repeats
+        matched = dict.fromkeys(_get_skills_pattern().findall(text_lower))
+
+        found_skills = [
+            Skill(
+                name=skill.title() if len(skill) > 3 else skill.upper(),
+                normalized_name=skill,
+                level=SkillLevel.INTERMEDIATE,
+                years_experience=None,
+            )
+            for skill in matched
+        ]
 
         logger.info(f"Regex fallback extracted {len(found_skills)} skills")
-        return found_skills
+        with self._skill_cache_lock:
+            self._skill_cache[text_hash] = found_skills
+            if len(self._skill_cache) > self.SKILL_CACHE_SIZE:
+                self._skill_cache.popitem(last=False)
+        return list(found_skills)
 
     def _extract_experience_years_regex(self, text: str) -> float:
         """
         P4.1: Fallback regex extraction for total experience years.
         """
-        from datetime import datetime
-        current_year = datetime.now().year
-
         # Pattern 1: "X+ years" or "X years"
-        years_pattern = r'(\d+)\+?\s*(?:years?|anos?)\s+(?:of\s+)?(?:experience|experiência)'
-        matches = re.findall(years_pattern, text, re.IGNORECASE)
-        if matches:
-            return float(max(int(m) for m in matches))
+        best_years = 0
+        found_years = False
+        for match in _YEARS_RE.finditer(text):
+            found_years = True
+            years = int(match.group(1))
+            if years > best_years:
+                best_years = years
+        if found_years:
+            return float(best_years)
 
         # Pattern 2: Count job entries with dates (2021 - Present, 2019 - 2021, etc.)
-        date_ranges = re.findall(
-            r'(\d{4})\s*[-–]\s*(?:Present|Presente|Atual|(\d{4}))',
-            text,
-            re.IGNORECASE
-        )
-        if date_ranges:
-            total_months = 0
-            for start, end in date_ranges:
-                start_year = int(start)
-                # Handle empty string when "Present" is matched
-                end_year = current_year if not end else int(end)
-
-                # Validate years are reasonable (1950 to current year + 1)
-                if not (1950 <= start_year <= current_year + 1):
-                    continue
-                if not (1950 <= end_year <= current_year + 1):
-                    continue
-                # Ensure start <= end
-                if start_year > end_year:
-                    continue
-
-                total_months += (end_year - start_year) * 12
-
-            if total_months > 0:
-                return round(total_months / 12, 1)
+        # "Present" end date; read per call so long-running workers roll over at New Year
+        current_year = datetime.now().year
+        total_months = 0
+        for match in _DATE_RANGE_RE.finditer(text):
+            start, end = match.groups()
+            start_year = int(start)
+            # end group is None when "Present" is matched
+            end_year = current_year if not end else int(end)
+
+            # Validate years are reasonable (1950 to current year + 1)
+            if not (1950 <= start_year <= current_year + 1):
+                continue
+            if not (1950 <= end_year <= current_year + 1):
+                continue
+            # Ensure start <= end
+            if start_year > end_year:
+                continue
+
+            total_months += (end_year - start_year) * 12
+
+        if total_months > 0:
+            return round(total_months / 12, 1)
 
         return 0.0
 
@@ -163,22 +313,26 @@ class ParseResumeUseCase:
             if not isinstance(s, dict):
                 continue
 
-            name = s.get("name") or ""
+            name = s.get("name")
             if not name:
                 continue
 
-            # Handle None values from LLM - use 'or' pattern
-            level_str = (s.get("level") or "intermediate").lower()
-            try:
-                level = SkillLevel(level_str)
-            except ValueError:
+            # Handle None values from LLM - use 'or' pattern; non-string levels
+            # (numbers, lists, dicts) fall back to intermediate
+            level_str = s.get("level") or "intermediate"
+            if isinstance(level_str, str):
+                level = _SKILL_LEVELS.get(level_str) or _SKILL_LEVELS.get(
+                    level_str.lower(), SkillLevel.INTERMEDIATE
+                )
+            else:
                 level = SkillLevel.INTERMEDIATE
 
+            # Skill is a plain dataclass - coerce LLM types before building it
             skills.append(Skill(
-                name=name,
-                normalized_name=s.get("normalized_name") or name,
+                name=str(name),
+                normalized_name=str(s.get("normalized_name") or name),
                 level=level,
-                years_experience=s.get("years_experience"),
+                years_experience=_to_optional_float(s.get("years_experience")),
             ))
 
         return skills
@@ -196,12 +350,17 @@ class ParseResumeUseCase:
             if not title or not company:
                 continue
 
+            # LLM output is almost always a plain int - only coerce the rest
+            duration = e.get("duration_months")
+            if type(duration) is not int:
+                duration = _to_optional_int(duration) or 0
+
             experiences.append(Experience(
-                title=title,
-                company=company,
-                duration_months=int(e.get("duration_months") or 0),
-                description=e.get("description") or "",
-                skills_used=e.get("skills_used") or [],
+                title=str(title),
+                company=str(company),
+                duration_months=duration if duration > 0 else 0,
+                description=str(e.get("description") or ""),
+                skills_used=_to_str_list(e.get("skills_used")),
             ))
 
         return experiences
@@ -221,17 +380,18 @@ class ParseResumeUseCase:
                 continue
 
             education.append(Education(
-                degree=degree,
-                field=field or "General",
-                institution=institution,
-                year=ed.get("year"),
+                degree=str(degree),
+                field=str(field or "General"),
+                institution=str(institution),
+                year=_to_optional_int(ed.get("year")),
             ))
 
         return education
 
-    def _extract_contact_regex(self, text: str) -> dict[str, Optional[str]]:
+    def _extract_contact_regex(self, text: str, text_lower: str) -> dict[str, Optional[str]]:
         """
         P4.2: Fallback regex extraction for contact information when LLM fails.
+        Email and LinkedIn are matched on text_lower; phone and name need the original text.
         """
         contact: dict[str, Optional[str]] = {
             "email": None,
@@ -241,43 +401,25 @@ class ParseResumeUseCase:
         }
 
         # Extract email
-        email_match = re.search(
-            r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}',
-            text
-        )
+        email_match = _EMAIL_RE.search(text_lower)
         if email_match:
-            contact["email"] = email_match.group(0).lower()
+            contact["email"] = email_match.group(0)
 
         # Extract phone (BR and international formats)
-        phone_patterns = [
-            r'\+?55\s*\(?0?\d{2}\)?\s*\d{4,5}[-.\s]?\d{4}',  # BR: +55 (11) 99999-8888
-            r'\(?0?\d{2}\)?\s*\d{4,5}[-.\s]?\d{4}',  # BR without country code
-            r'\+?1?[-.\s]?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}',  # US format
-        ]
-        for pattern in phone_patterns:
-            phone_match = re.search(pattern, text)
-            if phone_match:
-                contact["phone"] = phone_match.group(0)
-                break
+        phone_match = _PHONE_RE.search(text)
+        if phone_match:
+            contact["phone"] = phone_match.group(0)
 
         # Extract LinkedIn URL
-        linkedin_match = re.search(
-            r'(?:https?://)?(?:www\.)?linkedin\.com/in/[\w-]+',
-            text,
-            re.IGNORECASE
-        )
+        linkedin_match = _LINKEDIN_RE.search(text_lower)
         if linkedin_match:
             url = linkedin_match.group(0)
             if not url.startswith('http'):
                 url = 'https://' + url
             contact["linkedin_url"] = url
 
-        # Extract name (first line that looks like a name - capitalized words)
-        name_match = re.search(
-            r'^([A-Z][a-záéíóúàèìòùâêîôûãõç]+(?:\s+[A-Z][a-záéíóúàèìòùâêîôûãõç]+)+)',
-            text,
-            re.MULTILINE
-        )
+        # Extract name (first header line that looks like a name - capitalized words)
+        name_match = _NAME_RE.search(text, 0, _NAME_SEARCH_WINDOW)
         if name_match:
             contact["name"] = name_match.group(1)
 
@@ -3,7 +3,7 @@ Configuration module using Pydantic Settings.
 Loads environment variables for the AI Career Coach backend.
 """
 
-from functools import lru_cache
+from functools import cached_property, lru_cache
 from pydantic_settings import BaseSettings
 
 
@@ -50,13 +50,23 @@ class Settings(BaseSettings):
         env_file = ".env"
         extra = "ignore"
 
+    @cached_property
+    def allowed_origins_list(self) -> tuple[str, ...]:
+        """Allowed origins, parsed once per settings instance."""
+        return tuple(origin.strip() for origin in self.allowed_origins.split(","))
+
+    @cached_property
+    def allowed_extensions_list(self) -> tuple[str, ...]:
+        """Allowed file extensions, parsed once per settings instance."""
+        return tuple(ext.strip() for ext in self.allowed_extensions.split(","))
+
     def get_allowed_origins_list(self) -> list[str]:
-        """Get allowed origins as a list."""
-        return [origin.strip() for origin in self.allowed_origins.split(",")]
+        """Get allowed origins as a list (kept for existing callers)."""
+        return list(self.allowed_origins_list)
 
     def get_allowed_extensions_list(self) -> list[str]:
-        """Get allowed file extensions as a list."""
-        return [ext.strip() for ext in self.allowed_extensions.split(",")]
+        """Get allowed file extensions as a list (kept for existing callers)."""
+        return list(self.allowed_extensions_list)
 
 
 @lru_cache
@@ -1,8 +1,10 @@
 """Analysis result value objects."""
 
+import dataclasses
 from enum import Enum
+from functools import cached_property
 from typing import Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, computed_field
 
 
 class MatchLevel(str, Enum):
@@ -21,16 +23,14 @@ class KeywordWeight(str, Enum):
     LOW = "low"             # Minor boost
 
 
-class KeywordAnalysis(BaseModel):
+@dataclasses.dataclass(frozen=True, slots=True)
+class KeywordAnalysis:
     """Detailed keyword analysis with weight and observation."""
 
-    keyword: str = Field(..., description="The keyword being analyzed")
-    found_in_resume: bool = Field(..., description="Whether keyword was found in resume")
-    weight: KeywordWeight = Field(..., description="Importance weight of keyword")
-    observation: str = Field(..., description="Analysis observation for this keyword")
-
-    class Config:
-        frozen = True
+    keyword: str  # The keyword being analyzed
+    found_in_resume: bool  # Whether keyword was found in resume
+    weight: KeywordWeight  # Importance weight of keyword
+    observation: str  # Analysis observation for this keyword
 
 
 class ATSResult(BaseModel):
@@ -75,8 +75,7 @@ class ATSResult(BaseModel):
         description="Top 3-5 prioritized improvement actions"
     )
 
-    class Config:
-        frozen = True
+    model_config = ConfigDict(frozen=True, defer_build=True)
 
     def get_level(self) -> str:
         """Get score level as a string."""
@@ -90,28 +89,28 @@ class ATSResult(BaseModel):
             return "Poor"
 
 
-class SkillGap(BaseModel):
+@dataclasses.dataclass(frozen=True, slots=True)
+class SkillGap:
     """A skill gap between resume and job."""
 
-    skill: str = Field(..., description="Missing skill name")
-    is_required: bool = Field(default=True, description="Whether the skill is required or nice-to-have")
-    suggestion: str = Field(..., description="Actionable suggestion to address the gap")
-    learning_resources: list[str] = Field(default_factory=list, description="Resources to learn this skill")
-
-    class Config:
-        frozen = True
+    skill: str  # Missing skill name
+    suggestion: str  # Actionable suggestion to address the gap
+    is_required: bool = True  # Whether the skill is required or nice-to-have
+    learning_resources: list[str] = dataclasses.field(default_factory=list)  # Resources to learn this skill
 
 
-class RequirementMatch(BaseModel):
+@dataclasses.dataclass(frozen=True, slots=True)
+class RequirementMatch:
     """Individual requirement match analysis."""
 
-    requirement: str = Field(..., description="The job requirement being evaluated")
-    candidate_experience: str = Field(..., description="Candidate's relevant experience")
-    match_percentage: int = Field(..., ge=0, le=100, description="Match percentage for this requirement")
-    logic: str = Field(..., description="Explanation of the match logic")
+    requirement: str  # The job requirement being evaluated
+    candidate_experience: str  # Candidate's relevant experience
+    match_percentage: int  # Match percentage for this requirement (0-100)
+    logic: str  # Explanation of the match logic
 
-    class Config:
-        frozen = True
+    def __post_init__(self) -> None:
+        if not 0 <= self.match_percentage <= 100:
+            raise ValueError("match_percentage must be between 0 and 100")
 
 
 class JobMatch(BaseModel):
@@ -143,43 +142,32 @@ class JobMatch(BaseModel):
         description="Skills that transfer well to this role"
     )
 
-    class Config:
-        frozen = True
+    model_config = ConfigDict(frozen=True, defer_build=True)
 
 
-class StarMethod(BaseModel):
+@dataclasses.dataclass(frozen=True, slots=True)
+class StarMethod:
     """STAR method guidance for behavioral questions."""
 
-    situation: str = Field(..., description="How to frame the situation")
-    task: str = Field(..., description="How to describe your task/responsibility")
-    action: str = Field(..., description="How to explain your actions")
-    result: str = Field(..., description="How to present the results")
-
-    class Config:
-        frozen = True
+    situation: str  # How to frame the situation
+    task: str  # How to describe your task/responsibility
+    action: str  # How to explain your actions
+    result: str  # How to present the results
 
 
-class InterviewQuestion(BaseModel):
+@dataclasses.dataclass(frozen=True, slots=True)
+class InterviewQuestion:
     """Interview prep question with enhanced guidance."""
 
-    question: str = Field(..., description="The interview question")
-    category: str = Field(..., description="Category: screening, technical, behavioral, or curveball")
-    why_asked: str = Field(..., description="What the interviewer is seeking to evaluate")
-    what_to_say: list[str] = Field(default_factory=list, description="Key points to mention")
-    what_to_avoid: list[str] = Field(default_factory=list, description="Things to avoid saying")
+    question: str  # The interview question
+    category: str  # Category: screening, technical, behavioral, or curveball
+    why_asked: str  # What the interviewer is seeking to evaluate
+    what_to_say: list[str] = dataclasses.field(default_factory=list)  # Key points to mention
+    what_to_avoid: list[str] = dataclasses.field(default_factory=list)  # Things to avoid saying
 
     # Enhanced fields
-    your_angle: str = Field(
-        default="",
-        description="How to approach this question given your background"
-    )
-    star_guidance: Optional[StarMethod] = Field(
-        default=None,
-        description="STAR method guidance for behavioral questions"
-    )
-
-    class Config:
-        frozen = True
+    your_angle: str = ""  # How to approach this question given your background
+    star_guidance: Optional[StarMethod] = None  # STAR method guidance for behavioral questions
 
 
 class GapImpact(str, Enum):
@@ -190,29 +178,29 @@ class GapImpact(str, Enum):
     LOW = "low"                  # Minor concern
 
 
-class GapAnalysis(BaseModel):
+@dataclasses.dataclass(frozen=True, slots=True)
+class GapAnalysis:
     """Detailed gap analysis with action recommendations."""
 
-    gap: str = Field(..., description="The identified gap")
-    impact: GapImpact = Field(..., description="Impact level of this gap")
-    action: str = Field(..., description="Recommended action to address gap")
-    priority: int = Field(..., ge=1, le=5, description="Priority rank (1=highest)")
+    gap: str  # The identified gap
+    impact: GapImpact  # Impact level of this gap
+    action: str  # Recommended action to address gap
+    priority: int  # Priority rank (1=highest)
 
-    class Config:
-        frozen = True
+    def __post_init__(self) -> None:
+        if not 1 <= self.priority <= 5:
+            raise ValueError("priority must be between 1 and 5")
 
 
-class CoachingTip(BaseModel):
+@dataclasses.dataclass(frozen=True, slots=True)
+class CoachingTip:
     """Career coaching tip with enhanced analysis."""
 
-    category: str = Field(..., description="Category: quick_win, skill_gap, or strategy")
-    title: str = Field(..., description="Tip title")
-    description: str = Field(..., description="Detailed description")
-    action_items: list[str] = Field(default_factory=list, description="Actionable steps")
-    priority: str = Field(default="medium", description="Priority: high, medium, or low")
-
-    class Config:
-        frozen = True
+    category: str  # Category: quick_win, skill_gap, or strategy
+    title: str  # Tip title
+    description: str  # Detailed description
+    action_items: list[str] = dataclasses.field(default_factory=list)  # Actionable steps
+    priority: str = "medium"  # Priority: high, medium, or low
 
 
 class CoachingResult(BaseModel):
@@ -236,18 +224,29 @@ class CoachingResult(BaseModel):
         description="Alternative career paths or roles to consider"
     )
 
-    class Config:
-        frozen = True
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
+
+# LLM category spellings -> canonical interview question category
+QUESTION_CATEGORY_ALIASES: dict[str, str] = {
+    "screen": "screening",
+    "screening": "screening",
+    "tech": "technical",
+    "technical": "technical",
+    "coding": "technical",
+    "behavior": "behavioral",
+    "behavioral": "behavioral",
+    "soft": "behavioral",
+    "curve": "curveball",
+    "curveball": "curveball",
+    "tricky": "curveball",
+}
 
 
 class InterviewPrep(BaseModel):
     """Enhanced interview preparation result."""
 
     questions: list[InterviewQuestion] = Field(default_factory=list, description="Interview questions")
-    questions_by_category: dict[str, list[InterviewQuestion]] = Field(
-        default_factory=dict,
-        description="Questions organized by category"
-    )
     preparation_tips: list[str] = Field(
         default_factory=list,
         description="General preparation tips"
@@ -257,5 +256,14 @@ class InterviewPrep(BaseModel):
         description="Smart questions candidate should ask"
     )
 
-    class Config:
-        frozen = True
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
+    @computed_field
+    @cached_property
+    def questions_by_category(self) -> dict[str, list[InterviewQuestion]]:
+        """Questions organized by normalized category, derived once from questions."""
+        by_category: dict[str, list[InterviewQuestion]] = {}
+        for q in self.questions:
+            category = QUESTION_CATEGORY_ALIASES.get(q.category.lower(), "general")
+            by_category.setdefault(category, []).append(q)
+        return by_category
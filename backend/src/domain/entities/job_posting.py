@@ -1,19 +1,23 @@
 """Job posting entity and related value objects."""
 
 from enum import Enum
+from functools import cached_property
 from typing import Optional
-from pydantic import BaseModel, Field
+from dataclasses import dataclass
+from pydantic import BaseModel, ConfigDict, Field
 
 
-class JobRequirement(BaseModel):
+@dataclass(frozen=True, slots=True)
+class JobRequirement:
     """A single job requirement."""
 
-    skill: str = Field(..., description="Required skill name")
-    min_years: Optional[int] = Field(default=None, ge=0, description="Minimum years of experience")
-    is_required: bool = Field(default=True, description="True if required, False if nice-to-have")
+    skill: str  # Required skill name
+    min_years: Optional[int] = None  # Minimum years of experience
+    is_required: bool = True  # True if required, False if nice-to-have
 
-    class Config:
-        frozen = True
+    def __post_init__(self) -> None:
+        if self.min_years is not None and self.min_years < 0:
+            raise ValueError("min_years must be >= 0")
 
 
 class SeniorityLevel(str, Enum):
@@ -60,21 +64,44 @@ class JobPosting(BaseModel):
     salary_currency: str = Field(default="USD", description="Salary currency code")
     location: Optional[str] = Field(default=None, description="Job location")
 
-    def get_required_skills(self) -> set[str]:
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
+    @cached_property
+    def _skill_partition(self) -> tuple[frozenset[str], frozenset[str]]:
+        """(required, nice-to-have) lowercase skill names from one pass over requirements."""
+        required: set[str] = set()
+        nice_to_have = {s.lower() for s in self.preferred_skills}
+        for r in self.requirements:
+            (required if r.is_required else nice_to_have).add(r.skill.lower())
+        return frozenset(required), frozenset(nice_to_have)
+
+    @cached_property
+    def required_skills_lower(self) -> frozenset[str]:
+        """Required skill names (lowercase), computed once per posting."""
+        return self._skill_partition[0]
+
+    @cached_property
+    def all_skills_lower(self) -> frozenset[str]:
+        """All skill names (required + preferred, lowercase), computed once per posting."""
+        required, nice_to_have = self._skill_partition
+        return required | nice_to_have
+
+    @cached_property
+    def nice_to_have_skills_lower(self) -> frozenset[str]:
+        """Nice-to-have skill names (lowercase), computed once per posting."""
+        return self._skill_partition[1]
+
+    def get_required_skills(self) -> frozenset[str]:
         """Get required skill names as a set (lowercase)."""
-        return {r.skill.lower() for r in self.requirements if r.is_required}
+        return self.required_skills_lower
 
-    def get_all_skills(self) -> set[str]:
+    def get_all_skills(self) -> frozenset[str]:
         """Get all skill names (required + preferred) as a set (lowercase)."""
-        required = {r.skill.lower() for r in self.requirements}
-        preferred = {s.lower() for s in self.preferred_skills}
-        return required | preferred
+        return self.all_skills_lower
 
-    def get_nice_to_have_skills(self) -> set[str]:
+    def get_nice_to_have_skills(self) -> frozenset[str]:
         """Get nice-to-have skill names as a set (lowercase)."""
-        from_requirements = {r.skill.lower() for r in self.requirements if not r.is_required}
-        from_preferred = {s.lower() for s in self.preferred_skills}
-        return from_requirements | from_preferred
+        return self.nice_to_have_skills_lower
 
     def get_display_title(self) -> str:
         """Get a display-friendly job title."""
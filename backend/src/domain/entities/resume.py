@@ -1,22 +1,28 @@
 """Resume entity and related value objects."""
 
 import re
+from dataclasses import dataclass, field
+from functools import cached_property
 from enum import Enum
 from typing import Optional
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
-# Email validation pattern
+# Email pattern - searched on the lowercased value, so a clean address and
+# one embedded in surrounding text are handled by the same single pass
 EMAIL_PATTERN = re.compile(
-    r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
+    r'[a-z0-9._%+-]+@[a-z0-9.-]+\.[a-z]{2,}'
 )
 
-# LinkedIn URL pattern
+# LinkedIn URL pattern (searched, not anchored)
 LINKEDIN_PATTERN = re.compile(
-    r'^(https?://)?(www\.)?linkedin\.com/in/[\w-]+/?$',
+    r'(?:https?://)?(?:www\.)?linkedin\.com/in/[\w-]+/?',
     re.IGNORECASE
 )
 
+# Phone separators stripped by Resume.normalize_phone (\s covers all Unicode whitespace)
+_PHONE_SEPARATORS_RE = re.compile(r'[\s\-.()]')
+
 
 class SkillLevel(str, Enum):
     """Skill proficiency level."""
@@ -26,32 +32,39 @@ class SkillLevel(str, Enum):
     EXPERT = "expert"
 
 
-class Skill(BaseModel):
+@dataclass(frozen=True, slots=True)
+class Skill:
     """Normalized skill extracted from resume."""
 
-    name: str = Field(..., description="Original skill name as found in resume")
-    normalized_name: str = Field(..., description="Normalized/standardized skill name")
-    level: SkillLevel = Field(default=SkillLevel.INTERMEDIATE, description="Proficiency level")
-    years_experience: Optional[float] = Field(default=None, description="Years of experience with this skill")
-
-    class Config:
-        frozen = True
+    name: str  # Original skill name as found in resume
+    normalized_name: str  # Normalized/standardized skill name
+    level: SkillLevel = SkillLevel.INTERMEDIATE  # Proficiency level
+    years_experience: Optional[float] = None  # Years of experience with this skill
 
 
-class Experience(BaseModel):
+@dataclass(frozen=True, slots=True)
+class Experience:
     """Work experience entry."""
 
-    title: str = Field(..., description="Job title")
-    company: str = Field(..., description="Company name")
-    duration_months: int = Field(..., ge=0, description="Duration in months")
-    description: str = Field(default="", description="Role description")
-    skills_used: list[str] = Field(default_factory=list, description="Skills used in this role")
-    start_year: Optional[int] = Field(default=None, description="Start year (e.g., 2021)")
-    end_year: Optional[int] = Field(default=None, description="End year (None = current job)")
-
-    @field_validator('start_year', 'end_year', mode='before')
-    @classmethod
-    def validate_year(cls, v: Optional[int]) -> Optional[int]:
+    title: str  # Job title
+    company: str  # Company name
+    duration_months: int  # Duration in months
+    description: str = ""  # Role description
+    skills_used: list[str] = field(default_factory=list)  # Skills used in this role
+    start_year: Optional[int] = None  # Start year (e.g., 2021)
+    end_year: Optional[int] = None  # End year (None = current job)
+
+    def __post_init__(self) -> None:
+        if self.duration_months < 0:
+            raise ValueError("duration_months must be >= 0")
+        # Years are usually absent - only normalize (via object.__setattr__, frozen) when given
+        if self.start_year is not None:
+            object.__setattr__(self, "start_year", self.validate_year(self.start_year))
+        if self.end_year is not None:
+            object.__setattr__(self, "end_year", self.validate_year(self.end_year))
+
+    @staticmethod
+    def validate_year(v: Optional[int]) -> Optional[int]:
         """Validate year is reasonable (1950-2030)."""
         if v is None:
             return None
@@ -64,20 +77,15 @@ class Experience(BaseModel):
             return v
         return None
 
-    class Config:
-        frozen = True
-
 
-class Education(BaseModel):
+@dataclass(frozen=True, slots=True)
+class Education:
     """Education entry."""
 
-    degree: str = Field(..., description="Degree name (e.g., Bachelor's, Master's)")
-    field: str = Field(..., description="Field of study")
-    institution: str = Field(..., description="Educational institution name")
-    year: Optional[int] = Field(default=None, description="Graduation year")
-
-    class Config:
-        frozen = True
+    degree: str  # Degree name (e.g., Bachelor's, Master's)
+    field: str  # Field of study
+    institution: str  # Educational institution name
+    year: Optional[int] = None  # Graduation year
 
 
 class Resume(BaseModel):
@@ -103,19 +111,17 @@ class Resume(BaseModel):
     # Metadata
     filename: Optional[str] = Field(default=None, description="Original filename")
 
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
     @field_validator('email', mode='before')
     @classmethod
     def validate_email(cls, v: Optional[str]) -> Optional[str]:
         """Validate and clean email address."""
         if v is None or v == "":
             return None
-        v = v.strip().lower()
-        if EMAIL_PATTERN.match(v):
-            return v
-        # Try to extract email from text (fallback)
-        match = re.search(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}', v)
+        match = EMAIL_PATTERN.search(v.lower())
         if match:
-            return match.group(0).lower()
+            return match.group(0)
         return None  # Invalid email, set to None instead of raising
 
     @field_validator('linkedin_url', mode='before')
@@ -125,20 +131,16 @@ class Resume(BaseModel):
         if v is None or v == "":
             return None
         v = v.strip()
-        # Normalize URL
-        if not v.startswith(('http://', 'https://')):
-            if 'linkedin.com' in v.lower():
-                v = 'https://' + v.lstrip('/')
-        if LINKEDIN_PATTERN.match(v):
-            return v
-        # Try to extract LinkedIn from text
-        match = re.search(r'(?:https?://)?(?:www\.)?linkedin\.com/in/[\w-]+', v, re.IGNORECASE)
-        if match:
-            url = match.group(0)
-            if not url.startswith('http'):
-                url = 'https://' + url
-            return url
-        return None  # Invalid LinkedIn, set to None instead of raising
+        match = LINKEDIN_PATTERN.search(v)
+        if not match:
+            return None  # Invalid LinkedIn, set to None instead of raising
+        url = match.group(0)
+        if match.start() or match.end() != len(v):
+            # Extracted from surrounding text - drop the optional trailing slash
+            url = url.rstrip('/')
+        if not url.startswith(('http://', 'https://')):
+            url = 'https://' + url
+        return url
 
     @field_validator('phone', mode='before')
     @classmethod
@@ -147,24 +149,33 @@ class Resume(BaseModel):
         if v is None or v == "":
             return None
         # Remove common separators and normalize
-        v = re.sub(r'[\s\-\.\(\)]', '', v.strip())
+        v = _PHONE_SEPARATORS_RE.sub('', v)
         # Basic validation: should contain mostly digits
-        digits = re.sub(r'\D', '', v)
-        if len(digits) >= 8:  # Minimum phone length
+        if sum(map(str.isdecimal, v)) >= 8:  # Minimum phone length
             return v
         return None
 
-    def get_skill_names(self) -> set[str]:
+    @cached_property
+    def skill_names_lower(self) -> frozenset[str]:
+        """Normalized skill names (lowercase), computed once per resume."""
+        return frozenset(s.normalized_name.lower() for s in self.skills)
+
+    @cached_property
+    def skill_names_original(self) -> frozenset[str]:
+        """Original skill names, computed once per resume."""
+        return frozenset(s.name for s in self.skills)
+
+    def get_skill_names(self) -> frozenset[str]:
         """Get normalized skill names as a set (lowercase)."""
-        return {s.normalized_name.lower() for s in self.skills}
+        return self.skill_names_lower
 
-    def get_skill_names_original(self) -> set[str]:
+    def get_skill_names_original(self) -> frozenset[str]:
         """Get original skill names as a set."""
-        return {s.name for s in self.skills}
+        return self.skill_names_original
 
     def has_skill(self, skill_name: str) -> bool:
         """Check if resume contains a specific skill."""
-        return skill_name.lower() in self.get_skill_names()
+        return skill_name.lower() in self.skill_names_lower
 
     def get_experience_summary(self) -> str:
         """Get a summary of work experience."""
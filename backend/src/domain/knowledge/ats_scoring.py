@@ -1,6 +1,8 @@
 """ATS Scoring Knowledge Base - Scoring weights, patterns, and rules."""
 
 import re
+from functools import lru_cache
+from itertools import chain
 from typing import Any, Optional
 
 # ATS Scoring Weights (total = 100 points)
@@ -52,6 +54,19 @@ ATS_WEIGHTS: dict[str, dict[str, Any]] = {
     },
 }
 
+# Per-component maxima, unpacked once for the scoring helpers
+_SKILLS_MAX: int = ATS_WEIGHTS["skills"]["max_points"]
+_EXPERIENCE_MAX: int = ATS_WEIGHTS["experience"]["max_points"]
+_EDUCATION_MAX: int = ATS_WEIGHTS["education"]["max_points"]
+_CERTIFICATIONS_MAX: int = ATS_WEIGHTS["certifications"]["max_points"]
+_KEYWORDS_MAX: int = ATS_WEIGHTS["keywords"]["max_points"]
+
+# Rounded experience score per threshold tier, so scoring is a table lookup
+_EXPERIENCE_SCORES: dict[str, float] = {
+    tier: round(_EXPERIENCE_MAX * multiplier, 1)
+    for tier, multiplier in ATS_WEIGHTS["experience"]["thresholds"].items()
+}
+
 # Role-specific weight adjustments
 ROLE_WEIGHT_ADJUSTMENTS: dict[str, dict[str, float]] = {
     "technical": {
@@ -84,6 +99,15 @@ ROLE_WEIGHT_ADJUSTMENTS: dict[str, dict[str, float]] = {
     },
 }
 
+# Role weight relative to the base weight, per component; only depends on role_type
+_ROLE_WEIGHT_RATIOS: dict[str, dict[str, float]] = {
+    role: {
+        component: weight / ATS_WEIGHTS[component]["weight"]
+        for component, weight in adjustments.items()
+    }
+    for role, adjustments in ROLE_WEIGHT_ADJUSTMENTS.items()
+}
+
 # Contact information regex patterns
 CONTACT_PATTERNS: dict[str, str] = {
     "email": r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}",
@@ -91,7 +115,7 @@ CONTACT_PATTERNS: dict[str, str] = {
     "phone_br": r"(\+55[-.\s]?)?\(?\d{2}\)?[-.\s]?\d{4,5}[-.\s]?\d{4}",
     "linkedin": r"linkedin\.com/in/[\w-]+",
     "github": r"github\.com/[\w-]+",
-    "portfolio": r"https?://[\w.-]+\.[a-z]{2,}(?:/[\w.-]*)*",
+    "portfolio": r"\bhttps?://[A-Za-z0-9.-]{1,253}\.[a-z]{2,24}(?:/[\w./-]{0,256})?\b",
 }
 
 # Keyword categories for ATS matching
@@ -235,6 +259,14 @@ KEYWORD_CATEGORIES: dict[str, dict[str, Any]] = {
     },
 }
 
+# Reverse index keyword -> weight; built from the last category backwards so
+# the first category listing a keyword wins, as in a linear scan
+_KEYWORD_WEIGHT: dict[str, str] = {
+    example.lower(): data["weight"]
+    for data in reversed(list(KEYWORD_CATEGORIES.values()))
+    for example in data["examples"]
+}
+
 # Format issues that affect ATS parsing
 FORMAT_ISSUES: dict[str, dict[str, Any]] = {
     "special_characters": {
@@ -307,6 +339,7 @@ def calculate_ats_component_scores(
     """
     # Get role-specific weights
     weights = ROLE_WEIGHT_ADJUSTMENTS.get(role_type, ROLE_WEIGHT_ADJUSTMENTS["technical"])
+    ratios = _ROLE_WEIGHT_RATIOS.get(role_type, _ROLE_WEIGHT_RATIOS["technical"])
 
     scores = {}
 
@@ -318,8 +351,8 @@ def calculate_ats_component_scores(
     )
     scores["skills"] = {
         "score": skills_score,
-        "max": ATS_WEIGHTS["skills"]["max_points"],
-        "weighted": skills_score * weights["skills"] / ATS_WEIGHTS["skills"]["weight"],
+        "max": _SKILLS_MAX,
+        "weighted": skills_score * ratios["skills"],
     }
 
     # Experience score
@@ -329,8 +362,8 @@ def calculate_ats_component_scores(
     )
     scores["experience"] = {
         "score": exp_score,
-        "max": ATS_WEIGHTS["experience"]["max_points"],
-        "weighted": exp_score * weights["experience"] / ATS_WEIGHTS["experience"]["weight"],
+        "max": _EXPERIENCE_MAX,
+        "weighted": exp_score * ratios["experience"],
     }
 
     # Education score
@@ -340,8 +373,8 @@ def calculate_ats_component_scores(
     )
     scores["education"] = {
         "score": edu_score,
-        "max": ATS_WEIGHTS["education"]["max_points"],
-        "weighted": edu_score * weights["education"] / ATS_WEIGHTS["education"]["weight"],
+        "max": _EDUCATION_MAX,
+        "weighted": edu_score * ratios["education"],
     }
 
     # Certifications score
@@ -351,8 +384,8 @@ def calculate_ats_component_scores(
     )
     scores["certifications"] = {
         "score": cert_score,
-        "max": ATS_WEIGHTS["certifications"]["max_points"],
-        "weighted": cert_score * weights["certifications"] / ATS_WEIGHTS["certifications"]["weight"],
+        "max": _CERTIFICATIONS_MAX,
+        "weighted": cert_score * ratios["certifications"],
     }
 
     # Keywords score
@@ -362,8 +395,8 @@ def calculate_ats_component_scores(
     )
     scores["keywords"] = {
         "score": keywords_score,
-        "max": ATS_WEIGHTS["keywords"]["max_points"],
-        "weighted": keywords_score * weights["keywords"] / ATS_WEIGHTS["keywords"]["weight"],
+        "max": _KEYWORDS_MAX,
+        "weighted": keywords_score * ratios["keywords"],
     }
 
     # Calculate total
@@ -384,46 +417,56 @@ def _calculate_skills_score(
 ) -> float:
     """Calculate skills match score."""
     if not required_skills:
-        return ATS_WEIGHTS["skills"]["max_points"] * 0.5  # Partial score if no requirements
+        return _SKILLS_MAX * 0.5  # Partial score if no requirements
 
     resume_skills_lower = {s.lower() for s in resume_skills}
+    # Space-stripped forms for the fuzzy fallback, computed once per resume
+    resume_variants = [(skill, skill.replace(" ", "")) for skill in resume_skills_lower]
 
     # Required skills (70% of skill points)
-    required_matched = sum(
-        1 for skill in required_skills
-        if skill.lower() in resume_skills_lower or _fuzzy_skill_match(skill, resume_skills_lower)
-    )
+    required_matched = _count_skill_matches(required_skills, resume_skills_lower, resume_variants)
     required_ratio = required_matched / len(required_skills) if required_skills else 1.0
 
     # Preferred skills (30% of skill points)
-    preferred_matched = sum(
-        1 for skill in preferred_skills
-        if skill.lower() in resume_skills_lower or _fuzzy_skill_match(skill, resume_skills_lower)
-    )
+    preferred_matched = _count_skill_matches(preferred_skills, resume_skills_lower, resume_variants)
     preferred_ratio = preferred_matched / len(preferred_skills) if preferred_skills else 1.0
 
     subcats = ATS_WEIGHTS["skills"]["subcategories"]
     score = (
         required_ratio * subcats["required_skills"] +
         preferred_ratio * subcats["preferred_skills"]
-    ) * ATS_WEIGHTS["skills"]["max_points"]
+    ) * _SKILLS_MAX
 
     return round(score, 1)
 
 
-def _fuzzy_skill_match(skill: str, resume_skills: set[str]) -> bool:
-    """Check for fuzzy skill match (partial match or common variations)."""
+def _count_skill_matches(
+    skills: list[str],
+    resume_skills_lower: set[str],
+    resume_variants: list[tuple[str, str]],
+) -> int:
+    """Count skills found in the resume, exactly first and fuzzily for the rest."""
+    skills_lower = [skill.lower() for skill in skills]
+    misses = set(skills_lower) - resume_skills_lower
+    fuzzy_hits = {skill for skill in misses if _fuzzy_skill_match(skill, resume_variants)}
+    return sum(1 for skill in skills_lower if skill not in misses or skill in fuzzy_hits)
+
+
+def _fuzzy_skill_match(skill: str, resume_variants: list[tuple[str, str]]) -> bool:
+    """Check for fuzzy skill match against (resume skill, spaceless form) pairs."""
     skill_lower = skill.lower()
+    skill_spaced = skill_lower.replace("-", " ")
+    skill_compact = skill_lower.replace(" ", "")
 
-    # Check for partial matches
-    for resume_skill in resume_skills:
+    for resume_skill, resume_compact in resume_variants:
+        # Check for partial matches
         if skill_lower in resume_skill or resume_skill in skill_lower:
             return True
 
         # Check common variations
-        if skill_lower.replace("-", " ") in resume_skill:
+        if skill_spaced in resume_skill:
             return True
-        if skill_lower.replace(" ", "") in resume_skill.replace(" ", ""):
+        if skill_compact in resume_compact:
             return True
 
     return False
@@ -432,22 +475,17 @@ def _fuzzy_skill_match(skill: str, resume_skills: set[str]) -> bool:
 def _calculate_experience_score(candidate_years: float, required_years: int) -> float:
     """Calculate experience match score."""
     if required_years == 0:
-        return ATS_WEIGHTS["experience"]["max_points"]  # Full score if no requirement
-
-    thresholds = ATS_WEIGHTS["experience"]["thresholds"]
+        return _EXPERIENCE_MAX  # Full score if no requirement
 
     if candidate_years >= required_years:
-        multiplier = thresholds["exceeds"]
-    elif candidate_years >= required_years - 0.5:
-        multiplier = thresholds["meets"]
-    elif candidate_years >= required_years - 1:
-        multiplier = thresholds["close"]
-    elif candidate_years >= required_years - 2:
-        multiplier = thresholds["partial"]
-    else:
-        multiplier = thresholds["insufficient"]
-
-    return round(ATS_WEIGHTS["experience"]["max_points"] * multiplier, 1)
+        return _EXPERIENCE_SCORES["exceeds"]
+    if candidate_years >= required_years - 0.5:
+        return _EXPERIENCE_SCORES["meets"]
+    if candidate_years >= required_years - 1:
+        return _EXPERIENCE_SCORES["close"]
+    if candidate_years >= required_years - 2:
+        return _EXPERIENCE_SCORES["partial"]
+    return _EXPERIENCE_SCORES["insufficient"]
 
 
 def _calculate_education_score(
@@ -456,26 +494,22 @@ def _calculate_education_score(
 ) -> float:
     """Calculate education match score."""
     if not required_education:
-        return ATS_WEIGHTS["education"]["max_points"] * 0.8  # Default good score
+        return _EDUCATION_MAX * 0.8  # Default good score
 
     # Find highest education level in resume
-    highest_level = 0
-    for edu in resume_education:
-        degree = (edu.get("degree") or "").lower()
-        for level_name, level_value in EDUCATION_LEVELS.items():
-            if level_name in degree:
-                highest_level = max(highest_level, level_value)
+    highest_level = max(
+        (_education_level((edu.get("degree") or "").lower()) for edu in resume_education),
+        default=0,
+    )
 
     # Find required education level
-    required_level = 0
-    for req in required_education:
-        req_lower = req.lower()
-        for level_name, level_value in EDUCATION_LEVELS.items():
-            if level_name in req_lower:
-                required_level = max(required_level, level_value)
+    required_level = max(
+        (_education_level(req.lower()) for req in required_education),
+        default=0,
+    )
 
     if required_level == 0:
-        return ATS_WEIGHTS["education"]["max_points"] * 0.8
+        return _EDUCATION_MAX * 0.8
 
     if highest_level >= required_level:
         multiplier = 1.0
@@ -486,7 +520,16 @@ def _calculate_education_score(
     else:
         multiplier = 0.4
 
-    return round(ATS_WEIGHTS["education"]["max_points"] * multiplier, 1)
+    return round(_EDUCATION_MAX * multiplier, 1)
+
+
+def _education_level(text: str) -> int:
+    """Return the highest education level named in lowercased text, or 0."""
+    # EDUCATION_LEVELS is ordered highest to lowest, so the first hit wins
+    for level_name, level_value in EDUCATION_LEVELS.items():
+        if level_name in text:
+            return level_value
+    return 0
 
 
 def _calculate_certifications_score(
@@ -497,63 +540,71 @@ def _calculate_certifications_score(
     if not resume_certs:
         return 0.0
 
-    max_points = ATS_WEIGHTS["certifications"]["max_points"]
     bonus_per_cert = ATS_WEIGHTS["certifications"]["bonus_per_cert"]
 
     # Check for relevant certifications
     relevant_count = 0
-    job_keywords = " ".join(job_requirements).lower()
+    # Split once per call; dict.fromkeys drops repeated words but keeps order
+    job_keywords = tuple(dict.fromkeys(" ".join(job_requirements).lower().split()))
 
     for cert in resume_certs:
         cert_name = (cert.get("name") or cert if isinstance(cert, str) else "").lower()
         # Check if cert is relevant to job
-        if any(keyword in cert_name for keyword in job_keywords.split()):
+        if any(keyword in cert_name for keyword in job_keywords):
             relevant_count += 1
         elif _is_valuable_certification(cert_name):
             relevant_count += 0.5  # Partial credit for valuable certs
 
-    score = min(max_points, relevant_count * bonus_per_cert)
+    score = min(_CERTIFICATIONS_MAX, relevant_count * bonus_per_cert)
     return round(score, 1)
 
 
+_VALUABLE_CERTS: tuple[str, ...] = (
+    "aws", "azure", "gcp", "google cloud",
+    "kubernetes", "cka", "ckad",
+    "terraform", "docker",
+    "pmp", "scrum", "csm", "psm",
+    "cissp", "cism", "security+",
+    "ceh", "oscp",
+    "comptia", "cisco", "ccna", "ccnp",
+)
+
+# One alternation scans a cert name once instead of once per entry
+_VALUABLE_CERTS_RE = re.compile("|".join(map(re.escape, _VALUABLE_CERTS)))
+
+
 def _is_valuable_certification(cert_name: str) -> bool:
     """Check if certification is generally valuable."""
-    valuable_certs = [
-        "aws", "azure", "gcp", "google cloud",
-        "kubernetes", "cka", "ckad",
-        "terraform", "docker",
-        "pmp", "scrum", "csm", "psm",
-        "cissp", "cism", "security+",
-        "ceh", "oscp",
-        "comptia", "cisco", "ccna", "ccnp",
-    ]
-    return any(cert in cert_name for cert in valuable_certs)
+    return _VALUABLE_CERTS_RE.search(cert_name) is not None
 
 
 def _calculate_keywords_score(resume_data: dict, job_keywords: list[str]) -> float:
     """Calculate keyword match score."""
     if not job_keywords:
-        return ATS_WEIGHTS["keywords"]["max_points"] * 0.6  # Default moderate score
+        return _KEYWORDS_MAX * 0.6  # Default moderate score
 
     # Build resume text for keyword search
-    resume_text = " ".join([
-        " ".join(resume_data.get("skills", [])),
-        " ".join(exp.get("description", "") for exp in resume_data.get("experiences", [])),
-        " ".join(exp.get("title", "") for exp in resume_data.get("experiences", [])),
-    ]).lower()
+    # One pass over experiences; titles still follow all descriptions
+    descriptions = []
+    titles = []
+    for exp in resume_data.get("experiences", []):
+        descriptions.append(exp.get("description", ""))
+        titles.append(exp.get("title", ""))
+    resume_text = " ".join(chain(resume_data.get("skills", []), descriptions, titles)).lower()
 
     matched = sum(1 for kw in job_keywords if kw.lower() in resume_text)
     ratio = matched / len(job_keywords)
 
-    return round(ATS_WEIGHTS["keywords"]["max_points"] * ratio, 1)
+    return round(_KEYWORDS_MAX * ratio, 1)
 
 
 def detect_format_issues(resume_text: str) -> list[dict[str, Any]]:
     """Detect potential ATS format issues in resume text."""
     issues = []
 
-    # Check for special characters
-    if re.search(FORMAT_ISSUES["special_characters"]["pattern"], resume_text):
+    # Check for special characters; isascii() is equivalent to the
+    # FORMAT_ISSUES pattern without scanning the text with a regex
+    if not resume_text.isascii():
         issues.append({
             "issue": "special_characters",
             "description": FORMAT_ISSUES["special_characters"]["description"],
@@ -565,21 +616,24 @@ def detect_format_issues(resume_text: str) -> list[dict[str, Any]]:
 
 def get_keyword_weight(keyword: str) -> str:
     """Get the weight/importance of a keyword."""
-    keyword_lower = keyword.lower()
+    return _KEYWORD_WEIGHT.get(keyword.lower(), "medium")
 
-    for category, data in KEYWORD_CATEGORIES.items():
-        if keyword_lower in [ex.lower() for ex in data["examples"]]:
-            return data["weight"]
 
-    return "medium"
+@lru_cache
+def _contact_regexes() -> dict[str, re.Pattern[str]]:
+    """Compile CONTACT_PATTERNS on first use rather than at import."""
+    return {
+        contact_type: re.compile(pattern, re.IGNORECASE)
+        for contact_type, pattern in CONTACT_PATTERNS.items()
+    }
 
 
 def extract_contact_info(text: str) -> dict[str, Optional[str]]:
     """Extract contact information from resume text."""
     contact_info = {}
 
-    for contact_type, pattern in CONTACT_PATTERNS.items():
-        match = re.search(pattern, text, re.IGNORECASE)
+    for contact_type, pattern in _contact_regexes().items():
+        match = pattern.search(text)
         if match:
             contact_info[contact_type] = match.group()
         else:
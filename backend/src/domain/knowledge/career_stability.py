@@ -1,6 +1,8 @@
 """Career Stability Knowledge Base - Stability scoring, flags, and adjustments."""
 
+import re
 from datetime import datetime
+from functools import lru_cache
 from typing import Any, Optional
 
 # Stability flags and their score impacts
@@ -88,7 +90,7 @@ PJ_CLT_ADJUSTMENTS: dict[str, dict[str, Any]] = {
 }
 
 # Tech layoffs context 2022-2024 (for stability assessment)
-TECH_LAYOFF_COMPANIES: set[str] = {
+TECH_LAYOFF_COMPANIES: frozenset[str] = frozenset({
     # Major 2022-2024 layoffs - should not count against candidate
     "meta",
     "facebook",
@@ -162,7 +164,10 @@ TECH_LAYOFF_COMPANIES: set[str] = {
     "wellhub",
     "loggi",
     "madeira madeira",
-}
+})
+
+# ASCII shapes handled by _parse_date's fast path: YYYY-MM[-DD], MM/YYYY, YYYY
+_DATE_RE = re.compile(r"([0-9]{4})-([0-9]{1,2})(?:-([0-9]{1,2}))?|([0-9]{1,2})/([0-9]{4})|([0-9]{4})")
 
 # Layoff period (for context-aware stability scoring)
 LAYOFF_PERIOD = {
@@ -192,6 +197,17 @@ INDUSTRY_TENURE_EXPECTATIONS: dict[str, int] = {
     "government": 48,  # Very stable expected
 }
 
+# Thresholds and impacts read on every calculate_stability_score call
+_JOB_HOPPER_THRESHOLD: int = STABILITY_FLAGS["job_hopper"]["threshold"]
+_JOB_HOPPER_IMPACT: int = STABILITY_FLAGS["job_hopper"]["score_impact"]
+_FREQUENT_CHANGES_THRESHOLD: int = STABILITY_FLAGS["frequent_changes"]["threshold"]
+_FREQUENT_CHANGES_IMPACT: int = STABILITY_FLAGS["frequent_changes"]["score_impact"]
+_EMPLOYMENT_GAP_THRESHOLD: int = STABILITY_FLAGS["employment_gaps"]["threshold"]
+_EMPLOYMENT_GAP_IMPACT: int = STABILITY_FLAGS["employment_gaps"]["score_impact"]
+_LONG_TENURE_THRESHOLD: int = STABILITY_BONUSES["long_tenure"]["threshold"]
+_LONG_TENURE_BONUS: int = STABILITY_BONUSES["long_tenure"]["score_bonus"]
+_PJ_STABILITY_WEIGHT: float = PJ_CLT_ADJUSTMENTS["pj"]["stability_weight"]
+
 
 def calculate_stability_score(
     experiences: list[dict[str, Any]],
@@ -222,35 +238,40 @@ def calculate_stability_score(
     tenures = _calculate_tenures(experiences)
     gaps = _calculate_gaps(experiences)
 
-    # Base score starts at 100
-    score = 100
     flags = []
     positive_indicators = []
 
+    # Tenure statistics in one pass
+    short_jobs = 0
+    total_tenure = 0
+    max_tenure = 0
+    for tenure in tenures:
+        if tenure < 12:
+            short_jobs += 1
+        total_tenure += tenure
+        if tenure > max_tenure:
+            max_tenure = tenure
+
     # Apply stability flags
-    short_jobs = sum(1 for t in tenures if t < 12)
-    if short_jobs >= STABILITY_FLAGS["job_hopper"]["threshold"]:
-        score += STABILITY_FLAGS["job_hopper"]["score_impact"]
+    if short_jobs >= _JOB_HOPPER_THRESHOLD:
         flags.append({
             "flag": "job_hopper",
             "description": STABILITY_FLAGS["job_hopper"]["description"],
-            "impact": STABILITY_FLAGS["job_hopper"]["score_impact"],
+            "impact": _JOB_HOPPER_IMPACT,
         })
 
-    avg_tenure = sum(tenures) / len(tenures) if tenures else 0
-    if avg_tenure < STABILITY_FLAGS["frequent_changes"]["threshold"]:
-        score += STABILITY_FLAGS["frequent_changes"]["score_impact"]
+    avg_tenure = total_tenure / len(tenures) if tenures else 0
+    if avg_tenure < _FREQUENT_CHANGES_THRESHOLD:
         flags.append({
             "flag": "frequent_changes",
             "description": f"Average tenure: {avg_tenure:.0f} months",
-            "impact": STABILITY_FLAGS["frequent_changes"]["score_impact"],
+            "impact": _FREQUENT_CHANGES_IMPACT,
         })
 
     # Check for gaps
-    long_gaps = sum(1 for g in gaps if g > STABILITY_FLAGS["employment_gaps"]["threshold"])
+    long_gaps = sum(1 for g in gaps if g > _EMPLOYMENT_GAP_THRESHOLD)
     if long_gaps > 0:
-        impact = STABILITY_FLAGS["employment_gaps"]["score_impact"] * long_gaps
-        score += impact
+        impact = _EMPLOYMENT_GAP_IMPACT * long_gaps
         flags.append({
             "flag": "employment_gaps",
             "description": f"{long_gaps} gap(s) > 3 months",
@@ -258,12 +279,11 @@ def calculate_stability_score(
         })
 
     # Apply positive bonuses
-    if max(tenures, default=0) >= STABILITY_BONUSES["long_tenure"]["threshold"]:
-        score += STABILITY_BONUSES["long_tenure"]["score_bonus"]
+    if max_tenure >= _LONG_TENURE_THRESHOLD:
         positive_indicators.append({
             "indicator": "long_tenure",
             "description": "5+ years at single company",
-            "bonus": STABILITY_BONUSES["long_tenure"]["score_bonus"],
+            "bonus": _LONG_TENURE_BONUS,
         })
 
     # Check for layoff context
@@ -283,7 +303,7 @@ def calculate_stability_score(
         pj_count = sum(1 for e in experiences if _is_pj_contract(e))
         if pj_count > len(experiences) * 0.5:
             # Mostly PJ - reduce tenure expectations
-            adjustment = PJ_CLT_ADJUSTMENTS["pj"]["stability_weight"]
+            adjustment = _PJ_STABILITY_WEIGHT
             for flag in flags:
                 flag["impact"] = int(flag["impact"] * adjustment)
             positive_indicators.append({
@@ -294,13 +314,12 @@ def calculate_stability_score(
     # Industry adjustment
     expected_tenure = INDUSTRY_TENURE_EXPECTATIONS.get(industry, 24)
     if avg_tenure >= expected_tenure:
-        score += 5
         positive_indicators.append({
             "indicator": "meets_industry_standards",
             "description": f"Tenure meets {industry} expectations",
         })
 
-    # Recalculate score with adjusted flags
+    # Score from the final (possibly reduced) flag impacts plus bonuses; base is 100
     score = 100 + sum(f["impact"] for f in flags) + sum(p.get("bonus", 0) for p in positive_indicators)
 
     # Clamp score to 0-100
@@ -325,14 +344,12 @@ def _calculate_tenures(experiences: list[dict]) -> list[float]:
         start = exp.get("start_date")
         end = exp.get("end_date") or datetime.now().strftime("%Y-%m")
 
-        if start:
-            try:
-                start_date = _parse_date(start)
-                end_date = _parse_date(end)
-                months = (end_date.year - start_date.year) * 12 + (end_date.month - start_date.month)
-                tenures.append(max(1, months))  # Minimum 1 month
-            except (ValueError, AttributeError):
-                tenures.append(12)  # Default assumption
+        start_date = _parse_date(start) if start else None
+        end_date = _parse_date(end) if start_date else None
+
+        if start_date and end_date:
+            months = (end_date.year - start_date.year) * 12 + (end_date.month - start_date.month)
+            tenures.append(max(1, months))  # Minimum 1 month
         else:
             tenures.append(12)  # Default assumption
 
@@ -347,7 +364,7 @@ def _calculate_gaps(experiences: list[dict]) -> list[float]:
     # Sort by start date
     sorted_exp = sorted(
         experiences,
-        key=lambda x: _parse_date(x.get("start_date", "2000-01")),
+        key=lambda x: _parse_date_strict(x.get("start_date", "2000-01")),
     )
 
     gaps = []
@@ -356,23 +373,38 @@ def _calculate_gaps(experiences: list[dict]) -> list[float]:
         curr_start = sorted_exp[i].get("start_date")
 
         if prev_end and curr_start:
-            try:
-                end_date = _parse_date(prev_end)
-                start_date = _parse_date(curr_start)
+            end_date = _parse_date(prev_end)
+            start_date = _parse_date(curr_start)
+            if end_date and start_date:
                 gap_months = (start_date.year - end_date.year) * 12 + (start_date.month - end_date.month)
                 if gap_months > 0:
                     gaps.append(gap_months)
-            except (ValueError, AttributeError):
-                pass
 
     return gaps
 
 
-def _parse_date(date_str: str) -> datetime:
-    """Parse date string to datetime."""
+@lru_cache(maxsize=4096)
+def _parse_date(date_str: str) -> Optional[datetime]:
+    """Parse date string to datetime, or None if it is not a known format.
+
+    Failures are returned rather than raised so they are memoized too.
+    """
     if isinstance(date_str, datetime):
         return date_str
 
+    # Fast path for the usual shapes, without strptime's exception-driven retries
+    match = _DATE_RE.fullmatch(date_str)
+    if match:
+        year, month, day, slash_month, slash_year, year_only = match.groups()
+        try:
+            if year:
+                return datetime(int(year), int(month), int(day) if day else 1)
+            if slash_year:
+                return datetime(int(slash_year), int(slash_month), 1)
+            return datetime(int(year_only), 1, 1)
+        except ValueError:
+            pass  # Out-of-range parts; fall through to the strptime loop
+
     # Try common formats
     for fmt in ["%Y-%m", "%Y-%m-%d", "%m/%Y", "%Y"]:
         try:
@@ -382,54 +414,67 @@ def _parse_date(date_str: str) -> datetime:
 
     # Default to January of the year if only year provided
     if len(date_str) == 4 and date_str.isdigit():
-        return datetime(int(date_str), 1, 1)
+        try:
+            return datetime(int(date_str), 1, 1)
+        except ValueError:
+            return None
 
-    raise ValueError(f"Cannot parse date: {date_str}")
+    return None
+
+
+def _parse_date_strict(date_str: str) -> datetime:
+    """Parse date string to datetime, raising ValueError if unparseable."""
+    parsed = _parse_date(date_str)
+    if parsed is None:
+        raise ValueError(f"Cannot parse date: {date_str}")
+    return parsed
 
 
 def _check_layoff_context(experiences: list[dict]) -> bool:
     """Check if candidate was affected by tech layoffs."""
+    layoff_start = LAYOFF_PERIOD["start"]
+    layoff_end = LAYOFF_PERIOD["end"]
+
     for exp in experiences:
-        company = (exp.get("company") or "").lower()
         end_date_str = exp.get("end_date")
 
         if not end_date_str:
             continue
 
-        try:
-            end_date = _parse_date(end_date_str)
-        except ValueError:
+        end_date = _parse_date(end_date_str)
+        if end_date is None:
             continue
 
-        # Check if company had layoffs and job ended during layoff period
-        company_had_layoffs = any(
-            layoff_co in company for layoff_co in TECH_LAYOFF_COMPANIES
-        )
-        during_layoff_period = LAYOFF_PERIOD["start"] <= end_date <= LAYOFF_PERIOD["end"]
+        # Check the cheap date window before scanning the company list
+        if not layoff_start <= end_date <= layoff_end:
+            continue
 
-        if company_had_layoffs and during_layoff_period:
+        company = (exp.get("company") or "").lower()
+        if any(layoff_co in company for layoff_co in TECH_LAYOFF_COMPANIES):
             return True
 
     return False
 
 
+_PJ_INDICATORS: tuple[str, ...] = (
+    "contractor",
+    "freelance",
+    "consultant",
+    "pj",
+    "autonomo",
+    "autônomo",
+    "mei",
+    "consultoria",
+)
+
+
 def _is_pj_contract(experience: dict) -> bool:
     """Check if experience appears to be PJ (contractor) work."""
-    title = (experience.get("title") or "").lower()
-    company = (experience.get("company") or "").lower()
-
-    pj_indicators = [
-        "contractor",
-        "freelance",
-        "consultant",
-        "pj",
-        "autonomo",
-        "autônomo",
-        "mei",
-        "consultoria",
-    ]
-
-    return any(ind in title or ind in company for ind in pj_indicators)
+    # Lowercase title and company in one call; the newline keeps an indicator
+    # from matching across the two fields
+    text = f"{experience.get('title') or ''}\n{experience.get('company') or ''}".lower()
+
+    return any(ind in text for ind in _PJ_INDICATORS)
 
 
 def _generate_stability_analysis(
@@ -1,6 +1,7 @@
 """Job Titles Knowledge Base - 365+ tech titles with seniority mapping."""
 
 import re
+from functools import lru_cache
 from typing import Optional
 
 # Seniority level modifiers for title keywords
@@ -362,7 +363,40 @@ TITLE_ALIASES: dict[str, str] = {
     "sysadmin": "system administrator",
 }
 
-
+# Flattened (title, category, base_level), longest first so the first hit is the
+# most specific one ("ios developer" before "developer"); ties keep dict order
+_ROLE_TITLES: tuple[tuple[str, str, int], ...] = tuple(sorted(
+    (
+        (role_title, category, data["base_level"])
+        for category, data in ROLE_CATEGORIES.items()
+        for role_title in data["titles"]
+    ),
+    key=lambda entry: -len(entry[0]),
+))
+_ROLE_KEYWORDS: tuple[tuple[str, str], ...] = tuple(sorted(
+    (
+        (keyword, category)
+        for category, data in ROLE_CATEGORIES.items()
+        for keyword in data.get("keywords", [])
+    ),
+    key=lambda entry: -len(entry[0]),
+))
+
+# Single-pass alias expansion; no expansion contains an alias as a word, so
+# this matches applying each alias substitution in turn
+_ALIAS_RE = re.compile(r"\b(?:" + "|".join(map(re.escape, TITLE_ALIASES)) + r")\b")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Whole-word seniority keywords, longest first so "tech lead" beats "lead" and
+# "sr." beats "sr"; the lookarounds allow keywords ending in "."
+_SENIORITY_RE = re.compile(
+    r"(?<!\w)(?:"
+    + "|".join(map(re.escape, sorted(SENIORITY_KEYWORDS, key=len, reverse=True)))
+    + r")(?!\w)"
+)
+
+
+@lru_cache(maxsize=4096)
 def detect_seniority_from_title(title: str) -> tuple[int, str]:
     """
     Detect seniority level from job title.
@@ -379,23 +413,24 @@ def detect_seniority_from_title(title: str) -> tuple[int, str]:
     title_lower = title.lower().strip()
 
     # Check for aliases first
+    words = set(title_lower.split())
     for alias, full_title in TITLE_ALIASES.items():
-        if alias in title_lower.split():
+        if alias in words:
             title_lower = title_lower.replace(alias, full_title)
 
-    # Find base level from role category
+    # Find base level from the most specific matching role title
     base_level = 3  # Default mid-level
-    for category, data in ROLE_CATEGORIES.items():
-        for role_title in data["titles"]:
-            if role_title in title_lower:
-                base_level = data["base_level"]
-                break
-
-    # Apply seniority modifiers
-    modifier = 0
-    for keyword, mod in SENIORITY_KEYWORDS.items():
-        if keyword in title_lower:
-            modifier = max(modifier, mod) if mod > 0 else min(modifier, mod)
+    for role_title, _, level in _ROLE_TITLES:
+        if role_title in title_lower:
+            base_level = level
+            break
+
+    # Apply seniority modifiers: the strongest promotion wins, otherwise the
+    # strongest demotion
+    mods = [SENIORITY_KEYWORDS[keyword] for keyword in _SENIORITY_RE.findall(title_lower)]
+    modifier = max(mods, default=0)
+    if modifier <= 0:
+        modifier = min(mods, default=0)
 
     # Calculate final level (0-8 range)
     final_level = max(0, min(8, base_level + modifier))
@@ -403,6 +438,7 @@ def detect_seniority_from_title(title: str) -> tuple[int, str]:
     return final_level, LEVEL_NAMES.get(final_level, "Unknown")
 
 
+@lru_cache(maxsize=4096)
 def detect_category(title: str) -> Optional[str]:
     """
     Detect role category from job title.
@@ -419,16 +455,14 @@ def detect_category(title: str) -> Optional[str]:
     title_lower = title.lower().strip()
 
     # Check title matches first (more specific)
-    for category, data in ROLE_CATEGORIES.items():
-        for role_title in data["titles"]:
-            if role_title in title_lower:
-                return category
+    for role_title, category, _ in _ROLE_TITLES:
+        if role_title in title_lower:
+            return category
 
     # Check keyword matches (broader)
-    for category, data in ROLE_CATEGORIES.items():
-        for keyword in data.get("keywords", []):
-            if keyword in title_lower:
-                return category
+    for keyword, category in _ROLE_KEYWORDS:
+        if keyword in title_lower:
+            return category
 
     return None
 
@@ -449,6 +483,7 @@ def get_related_titles(title: str) -> list[str]:
     return []
 
 
+@lru_cache(maxsize=4096)
 def normalize_title(title: str) -> str:
     """
     Normalize a job title for comparison.
@@ -466,11 +501,9 @@ def normalize_title(title: str) -> str:
     normalized = title.lower().strip()
 
     # Expand aliases
-    for alias, full_title in TITLE_ALIASES.items():
-        pattern = r'\b' + re.escape(alias) + r'\b'
-        normalized = re.sub(pattern, full_title, normalized)
+    normalized = _ALIAS_RE.sub(lambda m: TITLE_ALIASES[m.group()], normalized)
 
     # Remove extra whitespace
-    normalized = re.sub(r'\s+', ' ', normalized)
+    normalized = _WHITESPACE_RE.sub(" ", normalized)
 
     return normalized
@@ -117,6 +117,14 @@ ACTION_VERBS_BY_LEVEL: dict[str, list[str]] = {
     ],
 }
 
+# Verb -> score; later levels overwrite earlier ones so a verb listed at several
+# levels scores at the highest, matching the leadership-first checks
+_VERB_SCORES: dict[str, float] = {
+    verb: score
+    for level, score in (("junior", 0.3), ("mid", 0.5), ("senior", 0.8), ("leadership", 1.0))
+    for verb in ACTION_VERBS_BY_LEVEL[level]
+}
+
 # Skill indicators by seniority level
 SKILL_INDICATORS: dict[str, dict[str, list[str]]] = {
     "junior": {
@@ -163,6 +171,14 @@ SKILL_INDICATORS: dict[str, dict[str, list[str]]] = {
     },
 }
 
+# Flattened (lowercased indicator, counts as senior) pairs for _score_skills
+_SKILL_INDEX: tuple[tuple[str, bool], ...] = tuple(
+    (skill.lower(), level in ("senior", "staff"))
+    for level, indicators in SKILL_INDICATORS.items()
+    for skill_list in indicators.values()
+    for skill in skill_list
+)
+
 # Impact scope indicators
 IMPACT_SCOPE: dict[str, dict[str, Any]] = {
     "individual": {
@@ -253,6 +269,14 @@ COMPLEXITY_PATTERNS: dict[str, list[str]] = {
     ],
 }
 
+# Weight of each factor in detect_seniority_level's combined score
+_FACTOR_WEIGHTS: dict[str, float] = {
+    "experience": 0.35,
+    "verbs": 0.25,
+    "skills": 0.25,
+    "leadership": 0.15,
+}
+
 
 def detect_seniority_level(
     years_experience: float,
@@ -282,9 +306,7 @@ def detect_seniority_level(
     }
 
     # Weighted average
-    weights = {"experience": 0.35, "verbs": 0.25, "skills": 0.25, "leadership": 0.15}
-
-    total_score = sum(scores[k] * weights[k] for k in scores)
+    total_score = sum(scores[k] * _FACTOR_WEIGHTS[k] for k in scores)
 
     # Map score to level
     level = _score_to_level(total_score)
@@ -303,9 +325,7 @@ def detect_seniority_level(
 
 
 def _score_experience(years: float, region: str) -> float:
-    """Score based on years of experience."""
-    thresholds = SENIORITY_THRESHOLDS.get(region, SENIORITY_THRESHOLDS["us"])
-
+    """Score based on years of experience (same cut-offs for every region)."""
     if years >= 15:
         return 1.0
     elif years >= 10:
@@ -327,18 +347,11 @@ def _score_action_verbs(verbs: list[str]) -> float:
     if not verbs:
         return 0.3
 
-    verbs_lower = [v.lower() for v in verbs]
-    scores = []
-
-    for verb in verbs_lower:
-        if verb in ACTION_VERBS_BY_LEVEL["leadership"]:
-            scores.append(1.0)
-        elif verb in ACTION_VERBS_BY_LEVEL["senior"]:
-            scores.append(0.8)
-        elif verb in ACTION_VERBS_BY_LEVEL["mid"]:
-            scores.append(0.5)
-        elif verb in ACTION_VERBS_BY_LEVEL["junior"]:
-            scores.append(0.3)
+    scores = [
+        _VERB_SCORES[verb]
+        for verb in (v.lower() for v in verbs)
+        if verb in _VERB_SCORES
+    ]
 
     return sum(scores) / len(scores) if scores else 0.3
 
@@ -348,17 +361,17 @@ def _score_skills(skills: list[str]) -> float:
     if not skills:
         return 0.3
 
-    skills_lower = [s.lower() for s in skills]
+    # Newline-joined so one substring test covers every skill; no indicator
+    # contains a newline, so a match cannot span two skills
+    skills_text = "\n".join(skills).lower()
     senior_count = 0
     total_matched = 0
 
-    for level, indicators in SKILL_INDICATORS.items():
-        for category, skill_list in indicators.items():
-            for skill in skill_list:
-                if any(skill.lower() in s for s in skills_lower):
-                    total_matched += 1
-                    if level in ["senior", "staff"]:
-                        senior_count += 1
+    for indicator, is_senior in _SKILL_INDEX:
+        if indicator in skills_text:
+            total_matched += 1
+            if is_senior:
+                senior_count += 1
 
     if total_matched == 0:
         return 0.3
@@ -85,6 +85,10 @@ WEIGHTS_BY_ROLE = {
     },
 }
 
+# Field keywords for partial education matches (e.g. "Computer Science" vs "CS")
+EDUCATION_FIELD_KEYWORDS = ("computer", "software", "engineering", "science")
+EDUCATION_REQUIREMENT_KEYWORDS = ("cs", "computer", "software", "engineering")
+
 
 @dataclass
 class ATSWeights:
@@ -374,6 +378,10 @@ class ATSScorer:
             return self.weights.education
 
         job_fields = {f.lower() for f in job.education_requirements}
+        # Does not depend on the resume entry, so evaluate it once
+        job_wants_technical_field = any(
+            keyword in req for req in job_fields for keyword in EDUCATION_REQUIREMENT_KEYWORDS
+        )
 
         # Check for field match
         for edu in resume.education:
@@ -382,9 +390,10 @@ class ATSScorer:
             if edu_field in job_fields:
                 return self.weights.education
             # Partial match (e.g., "Computer Science" matches "CS")
-            if any(keyword in edu_field for keyword in ["computer", "software", "engineering", "science"]):
-                if any(keyword in req for keyword in ["cs", "computer", "software", "engineering"] for req in job_fields):
-                    return self.weights.education
+            if job_wants_technical_field and any(
+                keyword in edu_field for keyword in EDUCATION_FIELD_KEYWORDS
+            ):
+                return self.weights.education
 
         # Generic degree credit
         return self.weights.education * 0.5
@@ -411,9 +420,11 @@ class ATSScorer:
         if not keywords:
             return self.weights.keywords, [], []
 
+        # Single partition pass - each keyword is lowercased and searched once
         text_lower = resume_text.lower()
-        matched = [kw for kw in keywords if kw.lower() in text_lower]
-        missing = [kw for kw in keywords if kw.lower() not in text_lower]
+        matched, missing = [], []
+        for kw in keywords:
+            (matched if kw.lower() in text_lower else missing).append(kw)
 
         coverage = len(matched) / len(keywords)
         score = coverage * self.weights.keywords
@@ -428,8 +439,8 @@ class ATSScorer:
         if "|" in text and text.count("|") > 10:
             issues.append("Tables detected - ATS may not parse correctly")
 
-        # Check length
-        word_count = len(text.split())
+        # Check length; splitting stops once the count passes the upper bound
+        word_count = len(text.split(None, 1500))
         if word_count < 200:
             issues.append("Resume seems too short - consider adding more detail")
         elif word_count > 1500:
@@ -543,10 +554,11 @@ class ATSScorer:
             ))
 
         # Analyze additional keywords (medium weight)
-        analyzed_keywords = required_skills | all_job_skills
+        analyzed_keywords = {s.lower() for s in required_skills | all_job_skills}
         for keyword in keywords:
-            if keyword.lower() not in {s.lower() for s in analyzed_keywords}:
-                found = keyword.lower() in text_lower
+            keyword_lower = keyword.lower()
+            if keyword_lower not in analyzed_keywords:
+                found = keyword_lower in text_lower
                 observation = (
                     f"Keyword '{keyword}' present - good for ATS parsing"
                     if found
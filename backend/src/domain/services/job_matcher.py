@@ -40,25 +40,9 @@ class JobMatcher:
         # Sort by match percentage (descending)
         matches.sort(key=lambda m: m.match_percentage, reverse=True)
 
-        # Mark best fit (first in sorted list)
+        # Mark best fit (first in sorted list) - already validated, so copy instead of rebuilding
         if matches:
-            best = matches[0]
-            matches[0] = JobMatch(
-                job_id=best.job_id,
-                job_title=best.job_title,
-                company=best.company,
-                match_percentage=best.match_percentage,
-                match_level=best.match_level,
-                matched_skills=best.matched_skills,
-                missing_skills=best.missing_skills,
-                skill_gaps=best.skill_gaps,
-                strengths=best.strengths,
-                concerns=best.concerns,
-                is_best_fit=True,
-                requirement_matrix=best.requirement_matrix,
-                weighted_calculation=best.weighted_calculation,
-                transferable_skills=best.transferable_skills,
-            )
+            matches[0] = matches[0].model_copy(update={"is_best_fit": True})
 
         return matches
 
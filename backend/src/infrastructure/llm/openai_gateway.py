@@ -1,16 +1,18 @@
 """OpenAI SDK Gateway - Compatible with OpenRouter, Ollama, or OpenAI."""
 
-import json
+import asyncio
 import logging
 from typing import Any, Optional, Union
 
-from openai import AsyncOpenAI
+from openai import AsyncOpenAI, RateLimitError
+from pydantic_core import from_json
 
 from src.config import get_settings
 from src.infrastructure.llm.prompts import (
     RESUME_EXTRACTION_PROMPT,
     RESUME_EXTRACTION_SYSTEM,
-    JOB_EXTRACTION_PROMPT,
+    JOB_EXTRACTION_PROMPT_PREFIX,
+    JOB_EXTRACTION_PROMPT_SUFFIX,
     JOB_EXTRACTION_SYSTEM,
     INTERVIEW_GENERATION_PROMPT,
     INTERVIEW_GENERATION_SYSTEM,
@@ -30,6 +32,13 @@ class OpenAIGateway:
     communicate with OpenRouter, Ollama, or OpenAI directly.
     """
 
+    # Completion call limits - bursts are bounded per gateway instance
+    MAX_CONCURRENT_LLM_CALLS = 16
+    # Rate-limit attempts for interview questions; backoff stays short (1s, 2s)
+    # so a sustained 429 still reaches the Gemini fallback quickly
+    INTERVIEW_RATE_LIMIT_ATTEMPTS = 3
+    MAX_RETRY_WAIT_SECONDS = 2
+
     def __init__(self):
         settings = get_settings()
 
@@ -49,6 +58,8 @@ class OpenAIGateway:
         self.model = settings.openai_model
         self.temperature = settings.openai_temperature
         self.max_tokens = settings.openai_max_tokens
+        # Created on first use so it belongs to the event loop that serves requests
+        self._llm_semaphore: Optional[asyncio.Semaphore] = None
 
         # Google Gemini fallback (direct API, bypasses OpenRouter rate limits)
         # Support multiple API keys for rate limit rotation
@@ -67,14 +78,53 @@ class OpenAIGateway:
         Returns:
             The assistant's response text
         """
-        response = await self.client.chat.completions.create(
-            model=self.model,
-            messages=messages,
-            temperature=self.temperature,
-            max_tokens=self.max_tokens,
+        response = await self._create_completion(
+            self.model, messages, self.temperature, self.max_tokens
         )
         return response.choices[0].message.content
 
+    async def _create_completion(
+        self,
+        model: str,
+        messages: list[dict[str, str]],
+        temperature: float,
+        max_tokens: int,
+        rate_limit_attempts: int = 1,
+    ) -> Any:
+        """
+        Create a chat completion with bounded concurrency.
+
+        With rate_limit_attempts > 1, rate limit errors are retried with
+        exponential backoff (1, 2... seconds, capped at MAX_RETRY_WAIT_SECONDS)
+        and the SDK's own retries are disabled, so each attempt is one request.
+        The last error is re-raised to the caller.
+        """
+        if self._llm_semaphore is None:
+            self._llm_semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_LLM_CALLS)
+
+        client = self.client
+        if rate_limit_attempts > 1:
+            client = client.with_options(max_retries=0)
+
+        for attempt in range(1, rate_limit_attempts + 1):
+            try:
+                async with self._llm_semaphore:
+                    return await client.chat.completions.create(
+                        model=model,
+                        messages=messages,
+                        temperature=temperature,
+                        max_tokens=max_tokens,
+                    )
+            except RateLimitError:
+                if attempt == rate_limit_attempts:
+                    raise
+                wait = min(2 ** (attempt - 1), self.MAX_RETRY_WAIT_SECONDS)
+                logger.warning(
+                    f"[{model}] Rate limited (attempt {attempt}/{rate_limit_attempts}), "
+                    f"retrying in {wait}s"
+                )
+                await asyncio.sleep(wait)
+
     async def _call_gemini_with_key(
         self,
         api_key: str,
@@ -173,26 +223,31 @@ class OpenAIGateway:
             # Close arrays first (innermost), then objects
             json_content += ']' * open_brackets + '}' * open_braces
 
-        # Fix common JSON issues from LLMs
-        # Remove trailing commas before ] or }
-        json_content = re.sub(r',(\s*[\]}])', r'\1', json_content)
-        # Fix newlines inside string values (replace with \n)
-        json_content = re.sub(r'(?<!\\)\n(?=[^"]*"[^"]*(?:"[^"]*"[^"]*)*$)', r'\\n', json_content)
-        # Replace single quotes with double quotes for keys (careful approach)
-        json_content = re.sub(r"(?<=[{,\s])'([^']+)'(?=\s*:)", r'"\1"', json_content)
-
         try:
-            result = json.loads(json_content)
-        except json.JSONDecodeError as e:
-            # Try one more fix: remove any control characters
+            # Well-formed output (the common case) parses as-is - the repairs below
+            # rescan the whole response (the newline fix is quadratic), so only run them on failure
+            result = from_json(json_content)
+        except ValueError:
+            # Fix common JSON issues from LLMs
+            # Remove trailing commas before ] or }
+            json_content = re.sub(r',(\s*[\]}])', r'\1', json_content)
+            # Fix newlines inside string values (replace with \n)
+            json_content = re.sub(r'(?<!\\)\n(?=[^"]*"[^"]*(?:"[^"]*"[^"]*)*$)', r'\\n', json_content)
+            # Replace single quotes with double quotes for keys (careful approach)
+            json_content = re.sub(r"(?<=[{,\s])'([^']+)'(?=\s*:)", r'"\1"', json_content)
+
             try:
-                cleaned = re.sub(r'[\x00-\x1f\x7f-\x9f]', '', json_content)
-                result = json.loads(cleaned)
-                logger.info("[Gemini] Successfully parsed JSON after cleanup")
-            except json.JSONDecodeError:
-                logger.warning(f"[Gemini] JSON parse error: {e}")
-                logger.debug(f"[Gemini] Raw content that failed: {content[:2000]}")
-                return None
+                result = from_json(json_content)
+            except ValueError as e:
+                # Try one more fix: remove any control characters
+                try:
+                    cleaned = re.sub(r'[\x00-\x1f\x7f-\x9f]', '', json_content)
+                    result = from_json(cleaned)
+                    logger.info("[Gemini] Successfully parsed JSON after cleanup")
+                except ValueError:
+                    logger.warning(f"[Gemini] JSON parse error: {e}")
+                    logger.debug(f"[Gemini] Raw content that failed: {content[:2000]}")
+                    return None
 
         if result and (isinstance(result, list) or any(result.values())):
             logger.info("[Gemini] Successfully parsed JSON response")
@@ -272,6 +327,7 @@ class OpenAIGateway:
         messages: list[dict[str, str]],
         temperature: float,
         max_tokens: int,
+        rate_limit_attempts: int = 1,
     ) -> Union[dict[str, Any], list[Any], None]:
         """
         Try to get JSON response from a specific model.
@@ -280,11 +336,8 @@ class OpenAIGateway:
             Parsed JSON, or None if failed/empty
         """
         try:
-            response = await self.client.chat.completions.create(
-                model=model,
-                messages=messages,
-                temperature=temperature,
-                max_tokens=max_tokens,
+            response = await self._create_completion(
+                model, messages, temperature, max_tokens, rate_limit_attempts
             )
 
             content = response.choices[0].message.content or ""
@@ -301,7 +354,7 @@ class OpenAIGateway:
             json_content = self._extract_json(content)
 
             try:
-                result = json.loads(json_content)
+                result = from_json(json_content)
                 # Check if result is meaningfully non-empty
                 if result and (isinstance(result, list) or any(result.values())):
                     logger.info(f"[{model}] Successfully parsed JSON response")
@@ -309,7 +362,7 @@ class OpenAIGateway:
                 else:
                     logger.warning(f"[{model}] Returned empty JSON structure")
                     return None
-            except json.JSONDecodeError as e:
+            except ValueError as e:
                 logger.error(f"[{model}] Failed to parse JSON: {e}")
                 logger.warning(f"[{model}] Raw response that failed: {content[:500]}")
                 return None
@@ -324,6 +377,7 @@ class OpenAIGateway:
         user_prompt: str,
         temperature: float = 0.0,
         max_tokens: Optional[int] = None,
+        rate_limit_attempts: int = 1,
     ) -> Union[dict[str, Any], list[Any]]:
         """
         Send a chat request expecting JSON response with automatic fallback.
@@ -333,6 +387,7 @@ class OpenAIGateway:
             user_prompt: User message with the request
             temperature: Temperature for this request (default 0.0 for deterministic JSON)
             max_tokens: Max tokens for this request (defaults to instance setting)
+            rate_limit_attempts: Primary model attempts on rate limit before falling back
 
         Returns:
             Parsed JSON response as dictionary or list
@@ -345,7 +400,7 @@ class OpenAIGateway:
 
         # Try primary model first
         result = await self._try_chat_json_with_model(
-            self.model, messages, temperature, tokens
+            self.model, messages, temperature, tokens, rate_limit_attempts
         )
 
         # If primary failed/empty, try Google Gemini directly (more reliable than OpenRouter fallback)
@@ -445,7 +500,8 @@ class OpenAIGateway:
         Returns:
             Dictionary with extracted job data
         """
-        prompt = JOB_EXTRACTION_PROMPT.format(job_text=text)
+        # Schema part of the prompt is pre-rendered at import; only the job text varies
+        prompt = JOB_EXTRACTION_PROMPT_PREFIX + text + JOB_EXTRACTION_PROMPT_SUFFIX
         # Use temperature=0.0 for deterministic JSON extraction
         result = await self._chat_json(JOB_EXTRACTION_SYSTEM, prompt, temperature=0.0, max_tokens=2500)
 
@@ -503,7 +559,13 @@ class OpenAIGateway:
         )
 
         # Use slightly higher temperature for creative question generation
-        result = await self._chat_json(INTERVIEW_GENERATION_SYSTEM, prompt, temperature=0.3, max_tokens=3500)
+        result = await self._chat_json(
+            INTERVIEW_GENERATION_SYSTEM,
+            prompt,
+            temperature=0.3,
+            max_tokens=3500,
+            rate_limit_attempts=self.INTERVIEW_RATE_LIMIT_ATTEMPTS,
+        )
 
         # Handle both list response and dict with questions key
         if isinstance(result, list):
@@ -40,3 +40,9 @@ Rules:
 - "Remote", "Work from home" → remote; "Hybrid" → hybrid; office-only → onsite
 - "Required"/"Must have" → is_required: true
 - "Preferred"/"Nice to have"/"Plus" → is_required: false"""
+
+# Prompt rendered once around the job text placeholder, so the escaped JSON schema
+# is not re-parsed by str.format on every request - callers concatenate the halves.
+JOB_EXTRACTION_PROMPT_PREFIX, JOB_EXTRACTION_PROMPT_SUFFIX = JOB_EXTRACTION_PROMPT.format(
+    job_text="{job_text}"
+).split("{job_text}")
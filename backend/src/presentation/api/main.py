@@ -52,7 +52,7 @@ app = FastAPI(
 
 # Configure CORS
 settings = get_settings()
-origins = settings.get_allowed_origins_list()
+origins = settings.allowed_origins_list
 
 app.add_middleware(
     CORSMiddleware,
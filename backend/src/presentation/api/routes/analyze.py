@@ -2,6 +2,7 @@
 
 import logging
 from fastapi import APIRouter, Depends, HTTPException
+from pydantic import TypeAdapter
 
 from src.presentation.schemas.requests import AnalyzeRequest, ATSScoreRequest, MatchJobsRequest
 from src.presentation.schemas.responses import AnalyzeResponse, ATSResultResponse, JobMatchResponse
@@ -11,6 +12,9 @@ from src.application.orchestrator import CareerCoachOrchestrator
 logger = logging.getLogger(__name__)
 router = APIRouter(tags=["Analysis"])
 
+# Validates the whole match list in one pydantic-core pass instead of one __init__ per item
+JOB_MATCH_LIST_ADAPTER = TypeAdapter(list[JobMatchResponse])
+
 
 @router.post("/analyze", response_model=AnalyzeResponse)
 async def analyze(
@@ -99,7 +103,7 @@ async def match_jobs(
                 for jp in request.job_postings
             ],
         )
-        return [JobMatchResponse(**m) for m in result["job_matches"]]
+        return JOB_MATCH_LIST_ADAPTER.validate_python(result["job_matches"])
     except Exception as e:
         logger.error(f"Job matching failed: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Job matching failed: {str(e)}")
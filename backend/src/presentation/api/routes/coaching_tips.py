@@ -4,7 +4,7 @@ import logging
 from fastapi import APIRouter, Depends, HTTPException
 
 from src.presentation.schemas.requests import CoachingTipsRequest
-from src.presentation.schemas.responses import CoachingTipsResponse, CoachingTipResponse
+from src.presentation.schemas.responses import CoachingTipsResponse
 from src.presentation.api.dependencies import get_orchestrator
 from src.application.orchestrator import CareerCoachOrchestrator
 
@@ -46,12 +46,8 @@ async def generate_coaching_tips(
             match_results=request.match_results,
         )
 
-        return CoachingTipsResponse(
-            tips=[
-                CoachingTipResponse(**t)
-                for t in result["tips"]
-            ],
-        )
+        # Nested tip dicts are validated in the same pass as the response
+        return CoachingTipsResponse(tips=result["tips"])
     except Exception as e:
         logger.error(f"Coaching tips generation failed: {e}", exc_info=True)
         raise HTTPException(
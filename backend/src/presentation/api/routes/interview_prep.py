@@ -4,7 +4,7 @@ import logging
 from fastapi import APIRouter, Depends, HTTPException
 
 from src.presentation.schemas.requests import InterviewPrepRequest
-from src.presentation.schemas.responses import InterviewPrepResponse, InterviewQuestionResponse
+from src.presentation.schemas.responses import InterviewPrepResponse
 from src.presentation.api.dependencies import get_orchestrator
 from src.application.orchestrator import CareerCoachOrchestrator
 
@@ -40,10 +40,8 @@ async def generate_interview_prep(
 
         return InterviewPrepResponse(
             job_title=result["job_title"],
-            questions=[
-                InterviewQuestionResponse(**q)
-                for q in result["questions"]
-            ],
+            # Nested question dicts are validated in the same pass as the response
+            questions=result["questions"],
         )
     except Exception as e:
         logger.error(f"Interview prep generation failed: {e}", exc_info=True)
@@ -62,7 +62,7 @@ async def upload_resume(file: UploadFile = File(...)):
     if not file.filename:
         raise HTTPException(status_code=400, detail="Filename is required")
 
-    allowed_extensions = settings.get_allowed_extensions_list()
+    allowed_extensions = settings.allowed_extensions_list
     file_ext = "." + file.filename.split(".")[-1].lower() if "." in file.filename else ""
 
     if file_ext not in allowed_extensions:
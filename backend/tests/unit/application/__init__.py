@@ -0,0 +1 @@
+# Application unit tests package
@@ -0,0 +1,28 @@
+"""Unit tests for the Generate Coaching Tips use case."""
+
+import pytest
+from src.application.use_cases.generate_coaching_tips import GenerateCoachingTipsUseCase
+
+
+class TestParseTips:
+    """Test cases for parsing LLM-generated coaching tips."""
+
+    def setup_method(self):
+        """Set up test fixtures (parsing never touches the gateway)."""
+        self.use_case = GenerateCoachingTipsUseCase(llm_gateway=None)
+
+    def parse(self, **fields):
+        return self.use_case._parse_tips([{"title": "Quantify results", **fields}])[0]
+
+    def test_bare_string_becomes_single_item(self):
+        """Test that a scalar action item string is not split into characters."""
+        assert self.parse(action_items="Add metrics").action_items == ["Add metrics"]
+
+    def test_list_items_are_kept(self):
+        """Test that list values are kept as strings, dropping nulls."""
+        assert self.parse(action_items=["Add metrics", None]).action_items == ["Add metrics"]
+
+    @pytest.mark.parametrize("value", [None, "", 7, {"step": "x"}])
+    def test_other_values_are_dropped(self, value):
+        """Test that non-list values yield an empty list."""
+        assert self.parse(action_items=value).action_items == []
@@ -0,0 +1,41 @@
+"""Unit tests for the Generate Interview Prep use case."""
+
+import pytest
+from src.application.use_cases.generate_interview_prep import GenerateInterviewPrepUseCase
+
+
+class TestParseQuestions:
+    """Test cases for parsing LLM-generated interview questions."""
+
+    def setup_method(self):
+        """Set up test fixtures (parsing never touches the gateway)."""
+        self.use_case = GenerateInterviewPrepUseCase(llm_gateway=None)
+
+    def parse(self, **fields):
+        question = {"question": "Tell me about yourself", "category": "screening", **fields}
+        return self.use_case._parse_questions([question], "resume", [])[0]
+
+    def test_bare_string_becomes_single_item(self):
+        """Test that a scalar string is not split into characters."""
+        question = self.parse(what_to_say="Be honest", what_to_avoid="Rambling")
+
+        assert question.what_to_say == ["Be honest"]
+        assert question.what_to_avoid == ["Rambling"]
+
+    def test_list_items_are_kept(self):
+        """Test that list values are kept as strings, dropping nulls."""
+        question = self.parse(what_to_say=["Impact", 3, None])
+
+        assert question.what_to_say == ["Impact", "3"]
+
+    @pytest.mark.parametrize("value", [None, "", 42, {"point": "x"}])
+    def test_other_values_are_dropped(self, value):
+        """Test that non-list values yield an empty list."""
+        assert self.parse(what_to_say=value).what_to_say == []
+
+    def test_null_fields_use_defaults(self):
+        """Test that null LLM fields fall back to defaults."""
+        question = self.parse(category=None, why_asked=None)
+
+        assert question.category == "general"
+        assert question.why_asked == ""
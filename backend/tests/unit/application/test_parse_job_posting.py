@@ -0,0 +1,50 @@
+"""Unit tests for the Parse Job Posting use case value coercion."""
+
+import pytest
+from src.application.use_cases.parse_job_posting import _to_bool, _to_int
+
+
+class TestToInt:
+    """Test cases for coercing LLM-provided year counts."""
+
+    @pytest.mark.parametrize(
+        "value, expected",
+        [(3, 3), (3.9, 3), ("3", 3), ("3-5", 3), ("5+ years", 5), ("at least 2 years", 2)],
+    )
+    def test_numbers_and_numeric_text(self, value, expected):
+        """Test that numbers and the first number in text are used."""
+        assert _to_int(value) == expected
+
+    @pytest.mark.parametrize("value", [-3, -3.0, "-3", " -3 years"])
+    def test_negative_values_clamp_to_zero(self, value):
+        """Test that negative numbers and numeric strings clamp the same way."""
+        assert _to_int(value) == 0
+
+    @pytest.mark.parametrize("value", [float("nan"), float("inf"), float("-inf")])
+    def test_non_finite_values_default_to_zero(self, value):
+        """Test that NaN/Infinity from the JSON parser do not raise."""
+        assert _to_int(value) == 0
+
+    @pytest.mark.parametrize("value", [None, "", "several", [], {}])
+    def test_non_numeric_values_default_to_zero(self, value):
+        """Test that non-numeric values default to zero."""
+        assert _to_int(value) == 0
+
+
+class TestToBool:
+    """Test cases for coercing LLM-provided flags."""
+
+    @pytest.mark.parametrize("value", [True, "true", "Yes", "required", 1])
+    def test_truthy_values(self, value):
+        """Test that truthy flags coerce to True."""
+        assert _to_bool(value) is True
+
+    @pytest.mark.parametrize("value", [False, "false", " No ", "0", "", 0])
+    def test_falsy_values(self, value):
+        """Test that falsy flags, including 'false' strings, coerce to False."""
+        assert _to_bool(value) is False
+
+    def test_none_uses_default(self):
+        """Test that a missing flag falls back to the default."""
+        assert _to_bool(None) is True
+        assert _to_bool(None, default=False) is False
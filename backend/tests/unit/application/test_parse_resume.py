@@ -0,0 +1,236 @@
+"""Unit tests for the Parse Resume use case."""
+
+import re
+from datetime import datetime
+
+import pytest
+from src.application.use_cases import parse_resume
+from src.domain.entities.resume import SkillLevel
+from src.application.use_cases.parse_resume import (
+    ParseResumeUseCase,
+    _build_trie_regex,
+    _to_optional_float,
+    _to_optional_int,
+)
+
+
+class StubLLMGateway:
+    """Gateway stub returning a fixed extraction result."""
+
+    def __init__(self, extracted: dict):
+        self.extracted = extracted
+
+    async def extract_resume(self, text: str) -> dict:
+        return self.extracted
+
+
+class TestParseResume:
+    """Test cases for ParseResumeUseCase."""
+
+    def setup_method(self):
+        """Set up test fixtures (regex fallbacks never touch the gateway)."""
+        self.use_case = ParseResumeUseCase(llm_gateway=None)
+
+
+class TestTrieRegex:
+    """Test cases for the trie-factored skill alternation."""
+
+    def test_nested_skill_reports_longest_match_only(self):
+        """Test that 'react native' consumes its span instead of also reporting 'react'."""
+        pattern = re.compile(r"\b" + _build_trie_regex(sorted(["react", "react native"])) + r"\b")
+
+        assert pattern.findall("react native and react") == ["react native", "react"]
+
+    def test_prefix_words_share_one_branch(self):
+        """Test that words sharing a prefix are factored into one branch."""
+        assert _build_trie_regex(["java", "javascript"]) == "java(?:script)?"
+
+    def test_matches_same_words_as_longest_first_alternation(self):
+        """Test that the trie finds the same matches as a longest-first alternation."""
+        words = ["go", "golang", "gcp", "git", "gitlab ci"]
+        text = "go golang gcp git gitlab ci gitlab"
+        trie = re.compile(r"\b" + _build_trie_regex(sorted(words)) + r"\b")
+        plain = re.compile(r"\b(?:" + "|".join(sorted(words, key=len, reverse=True)) + r")\b")
+
+        assert trie.findall(text) == plain.findall(text) == ["go", "golang", "gcp", "git", "gitlab ci"]
+
+
+class TestNumberCoercion:
+    """Test cases for coercing LLM-provided numbers."""
+
+    @pytest.mark.parametrize("value, expected", [(3, 3.0), (2.5, 2.5), ("4", 4.0), (" 1.5 ", 1.5)])
+    def test_numeric_values_become_float(self, value, expected):
+        """Test that numbers and numeric strings are coerced to float."""
+        assert _to_optional_float(value) == expected
+
+    @pytest.mark.parametrize("value", [None, True, "", "n/a", [], "nan", "inf", "-Infinity", float("nan")])
+    def test_non_numeric_or_non_finite_values_become_none(self, value):
+        """Test that non-numeric and non-finite values are rejected."""
+        assert _to_optional_float(value) is None
+        assert _to_optional_int(value) is None
+
+    def test_int_truncates(self):
+        """Test that ints are truncated from the float value."""
+        assert _to_optional_int("36.9") == 36
+
+
+class TestParseSkills(TestParseResume):
+    """Test cases for parsing LLM-extracted skills."""
+
+    @pytest.mark.parametrize(
+        "level, expected",
+        [
+            ("expert", SkillLevel.EXPERT),
+            ("Advanced", SkillLevel.ADVANCED),
+            (None, SkillLevel.INTERMEDIATE),
+            ("guru", SkillLevel.INTERMEDIATE),
+            (3, SkillLevel.INTERMEDIATE),
+            (["expert"], SkillLevel.INTERMEDIATE),
+            ({"level": "expert"}, SkillLevel.INTERMEDIATE),
+        ],
+    )
+    def test_level_resolution(self, level, expected):
+        """Test that skill levels resolve case-insensitively and default to intermediate."""
+        skills = self.use_case._parse_skills([{"name": "Python", "level": level}])
+
+        assert skills[0].level == expected
+
+
+class TestExtractExperienceYearsRegex(TestParseResume):
+    """Test cases for the regex experience-years fallback."""
+
+    def test_explicit_years_take_the_maximum(self):
+        """Test that the largest 'X years of experience' mention wins."""
+        text = "3 years of experience in Python, 7+ years experience overall"
+
+        assert self.use_case._extract_experience_years_regex(text) == 7.0
+
+    def test_present_range_ends_at_current_year(self):
+        """Test that 'Present' date ranges end at the current year."""
+        start = datetime.now().year - 3
+
+        assert self.use_case._extract_experience_years_regex(f"{start} - Present") == 3.0
+
+    def test_current_year_is_read_per_call(self, monkeypatch):
+        """Test that a year rollover is picked up without re-importing the module."""
+
+        class NextYear(datetime):
+            @classmethod
+            def now(cls, tz=None):
+                return datetime(datetime.now().year + 1, 1, 1)
+
+        text = f"{datetime.now().year} - Present"
+        assert self.use_case._extract_experience_years_regex(text) == 0.0
+
+        monkeypatch.setattr(parse_resume, "datetime", NextYear)
+        assert self.use_case._extract_experience_years_regex(text) == 1.0
+
+
+class TestParseExperiences(TestParseResume):
+    """Test cases for parsing LLM-extracted experiences."""
+
+    def parse(self, **fields):
+        experience = {"title": "Engineer", "company": "Acme", **fields}
+        return self.use_case._parse_experiences([experience])[0]
+
+    def test_bare_skills_string_becomes_single_item(self):
+        """Test that a scalar skills_used string is not split into characters."""
+        assert self.parse(skills_used="Python, Java").skills_used == ["Python, Java"]
+
+    def test_skills_list_is_kept(self):
+        """Test that list values are kept as strings, dropping nulls."""
+        assert self.parse(skills_used=["Python", None, "Java"]).skills_used == ["Python", "Java"]
+
+    @pytest.mark.parametrize("value", [None, "", 5, {"name": "Python"}])
+    def test_other_skills_values_are_dropped(self, value):
+        """Test that non-list values yield an empty list."""
+        assert self.parse(skills_used=value).skills_used == []
+
+    @pytest.mark.parametrize("duration, expected", [(24, 24), ("18", 18), ("nan", 0), (-6, 0)])
+    def test_duration_months_is_coerced(self, duration, expected):
+        """Test that durations are coerced to non-negative ints."""
+        assert self.parse(duration_months=duration).duration_months == expected
+
+
+class TestExtractSkillsRegex(TestParseResume):
+    """Test cases for the regex skill fallback."""
+
+    def test_longer_skill_does_not_report_its_prefix(self):
+        """Test that 'javascript' is not also reported as 'java'."""
+        skills = self.use_case._extract_skills_regex("javascript developer")
+
+        assert [s.normalized_name for s in skills] == ["javascript"]
+
+    def test_skills_keep_first_seen_order_without_duplicates(self):
+        """Test that skills are reported once, in order of first appearance."""
+        text = "python and docker, then python again with aws and docker"
+        skills = self.use_case._extract_skills_regex(text)
+
+        assert [s.normalized_name for s in skills] == ["python", "docker", "aws"]
+
+    def test_skill_names_are_formatted(self):
+        """Test that short skills are uppercased and longer ones title-cased."""
+        skills = self.use_case._extract_skills_regex("aws and deep learning")
+
+        assert [s.name for s in skills] == ["AWS", "Deep Learning"]
+
+    def test_cache_hit_returns_independent_list(self):
+        """Test that a cached result is returned as a new list callers may mutate."""
+        text = "python, docker and kubernetes"
+        first = self.use_case._extract_skills_regex(text)
+        first.clear()
+
+        second = self.use_case._extract_skills_regex(text)
+        third = self.use_case._extract_skills_regex(text)
+
+        assert [s.normalized_name for s in second] == ["python", "docker", "kubernetes"]
+        assert second == third
+        assert second is not third
+
+    def test_cache_evicts_least_recently_used(self):
+        """Test that the cache is bounded and drops the oldest entry first."""
+        self.use_case.SKILL_CACHE_SIZE = 2
+        for text in ("python", "docker", "python", "aws"):
+            self.use_case._extract_skills_regex(text)
+
+        assert len(self.use_case._skill_cache) == 2
+        cached_names = [skills[0].normalized_name for skills in self.use_case._skill_cache.values()]
+        assert cached_names == ["python", "aws"]
+
+    @pytest.mark.parametrize("text", ["", "no known skills here"])
+    def test_no_skills_found(self, text):
+        """Test that text without known skills yields an empty list."""
+        assert self.use_case._extract_skills_regex(text) == []
+
+
+class TestExecuteFallbacks:
+    """Test cases for the regex fallbacks run by execute()."""
+
+    async def test_fallbacks_fill_missing_llm_fields(self):
+        """Test that skills and contact info come from regex when the LLM returns none."""
+        text = "Maria Silva\nmaria@example.com\nPython and Docker, 2019 - 2021"
+        use_case = ParseResumeUseCase(StubLLMGateway({}))
+
+        resume = await use_case.execute(text)
+
+        assert [s.normalized_name for s in resume.skills] == ["python", "docker"]
+        assert resume.email == "maria@example.com"
+        assert resume.name == "Maria Silva"
+        assert resume.total_experience_years == 2.0
+
+    async def test_complete_llm_result_skips_fallbacks(self):
+        """Test that LLM-provided fields are kept when no fallback is needed."""
+        extracted = {
+            "skills": [{"name": "Rust", "level": "expert"}],
+            "email": "dev@example.com",
+            "phone": "+1 555 123 4567",
+            "total_experience_years": 4,
+        }
+        use_case = ParseResumeUseCase(StubLLMGateway(extracted))
+
+        resume = await use_case.execute("Python and Docker\nother@example.com")
+
+        assert [s.name for s in resume.skills] == ["Rust"]
+        assert resume.email == "dev@example.com"
+        assert resume.total_experience_years == 4.0
+        assert not use_case._skill_cache
@@ -0,0 +1,61 @@
+"""Unit tests for the Job Titles knowledge base."""
+
+import pytest
+from src.domain.knowledge.job_titles import (
+    detect_category,
+    detect_seniority_from_title,
+)
+
+
+class TestDetectCategory:
+    """Test cases for role category detection."""
+
+    @pytest.mark.parametrize(
+        "title, category",
+        [
+            ("iOS Developer", "mobile"),
+            ("Senior Android Developer", "mobile"),
+            ("React Native Developer", "mobile"),
+            ("ETL Developer", "data_engineering"),
+            ("Data Platform Engineer", "data_engineering"),
+            ("AI/ML Engineer", "ai_ml"),
+            ("Analista de Negócios", "analyst"),
+        ],
+    )
+    def test_longest_matching_title_wins(self, title, category):
+        """Test that the most specific title beats a generic one like 'developer'."""
+        assert detect_category(title) == category
+
+    def test_generic_title_keeps_its_category(self):
+        """Test that a title without a more specific match still resolves."""
+        assert detect_category("Backend Developer") == "software_engineering"
+
+    def test_falls_back_to_keywords(self):
+        """Test that keywords are used when no title matches."""
+        assert detect_category("Team Leader") == "management"
+
+    def test_empty_title_returns_none(self):
+        """Test that an empty title has no category."""
+        assert detect_category("") is None
+
+
+class TestDetectSeniorityFromTitle:
+    """Test cases for base level selection from the matching title."""
+
+    def test_base_level_comes_from_longest_title(self):
+        """Test that the base level is taken from the most specific title."""
+        assert detect_seniority_from_title("Analista de Negócios") == (4, "Senior")
+        assert detect_seniority_from_title("ETL Developer") == (4, "Senior")
+
+    def test_equal_length_titles_keep_category_order(self):
+        """Test that ties between categories resolve to the first category."""
+        assert detect_category("Platform Engineer") == "software_engineering"
+        assert detect_seniority_from_title("Platform Engineer") == (3, "Mid-Level")
+
+    def test_modifier_applies_on_specific_base_level(self):
+        """Test that seniority modifiers add to the specific title's base level."""
+        assert detect_seniority_from_title("Senior iOS Developer") == (5, "Staff/Lead")
+
+    def test_empty_title_defaults_to_mid_level(self):
+        """Test that an empty title defaults to mid-level."""
+        assert detect_seniority_from_title("") == (3, "Mid-Level")
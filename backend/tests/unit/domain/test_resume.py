@@ -0,0 +1,29 @@
+"""Unit tests for the Resume entity."""
+
+import pytest
+from src.domain.entities.resume import Resume
+
+
+class TestNormalizePhone:
+    """Test cases for phone number normalization."""
+
+    @pytest.mark.parametrize(
+        "raw, expected",
+        [
+            ("+55 (11) 99999-8888", "+5511999998888"),
+            ("555.123.4567", "5551234567"),
+            ("+33\u202f6\u202f12\u202f34\u202f56\u202f78", "+33612345678"),  # narrow no-break spaces
+            ("+33\u00a06\u00a012\u00a034\u00a056\u00a078", "+33612345678"),  # no-break spaces
+            ("(11) 3456\u20037890\u2009", "1134567890"),  # em space and trailing thin space
+        ],
+    )
+    def test_strips_separators_including_unicode_whitespace(self, raw, expected):
+        """Test that separators and any Unicode whitespace are removed."""
+        resume = Resume(id="test", raw_content="", phone=raw)
+
+        assert resume.phone == expected
+
+    @pytest.mark.parametrize("raw", [None, "", "123-45", "call me"])
+    def test_short_or_missing_numbers_become_none(self, raw):
+        """Test that values with fewer than 8 digits are dropped."""
+        assert Resume(id="test", raw_content="", phone=raw).phone is None
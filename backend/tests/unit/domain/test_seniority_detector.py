@@ -11,6 +11,7 @@ from src.domain.services.seniority_detector import (
     MID_SKILLS,
 )
 from src.domain.entities.resume import Resume, Skill, Experience, SkillLevel
+from src.domain.knowledge.job_titles import detect_seniority_from_title
 
 
 class TestSeniorityDetector:
@@ -509,3 +510,39 @@ class TestSeniorityDetection(TestSeniorityDetector):
         result = self.detector.detect(resume)
 
         assert result.level == SeniorityLevel.MID
+
+
+class TestTitleSeniorityKeywords:
+    """Test whole-word seniority keyword matching in job titles."""
+
+    def test_abbreviation_glued_to_title_is_detected(self):
+        """Test that 'Sr.Developer' gets the senior modifier like 'Sr. Developer'."""
+        assert detect_seniority_from_title("Sr.Developer") == detect_seniority_from_title("Sr. Developer")
+        assert detect_seniority_from_title("Sr.Developer")[0] == 5
+
+    def test_tech_lead_beats_lead(self):
+        """Test that 'Tech Lead' applies the +3 'tech lead' modifier, not +2 'lead'."""
+        level, _ = detect_seniority_from_title("Tech Lead Developer")
+        lead_level, _ = detect_seniority_from_title("Lead Developer")
+
+        assert level == 6
+        assert lead_level == 5
+
+    def test_international_does_not_match_intern(self):
+        """Test that 'International' is not read as the 'intern' keyword."""
+        level, _ = detect_seniority_from_title("International Sales Developer")
+
+        assert level == detect_seniority_from_title("Developer")[0]
+        assert detect_seniority_from_title("Intern Developer")[0] == 0
+
+    def test_team_leader_does_not_match_team_lead(self):
+        """Test that 'Team Leader' gets no modifier while 'Team Lead' does."""
+        assert detect_seniority_from_title("Team Leader")[0] == 3
+        assert detect_seniority_from_title("Team Lead")[0] == 5
+
+    def test_strongest_promotion_wins_over_demotion(self):
+        """Test that a promotion keyword outranks a demotion keyword."""
+        level, name = detect_seniority_from_title("Senior Intern")
+
+        assert level == 5
+        assert name == "Staff/Lead"
@@ -0,0 +1,115 @@
+"""Unit tests for the OpenAI gateway rate-limit handling."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from openai import RateLimitError
+
+from src.config import get_settings
+from src.infrastructure.llm import OpenAIGateway
+
+
+class FakeRateLimitError(RateLimitError):
+    """RateLimitError without an HTTP response attached."""
+
+    def __init__(self):
+        Exception.__init__(self, "rate limited")
+
+
+class FakeClient:
+    """Client stub whose completions fail with rate limits a set number of times."""
+
+    def __init__(self, events: list[str], rate_limited_calls: int):
+        self.events = events
+        self.rate_limited_calls = rate_limited_calls
+        self.options: list[dict] = []
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+
+    def with_options(self, **options):
+        self.options.append(options)
+        return self
+
+    async def _create(self, **kwargs):
+        self.events.append("openai")
+        if self.rate_limited_calls:
+            self.rate_limited_calls -= 1
+            raise FakeRateLimitError()
+        message = SimpleNamespace(content='[{"question": "Why us?"}]')
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+@pytest.fixture
+def events() -> list[str]:
+    return []
+
+
+@pytest.fixture
+def gateway(monkeypatch, events):
+    """Gateway with a Gemini fallback stub and no real backoff sleeps."""
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    get_settings.cache_clear()
+    gateway = OpenAIGateway()
+    gateway.gemini_api_keys = ["gemini-key"]
+
+    async def fake_gemini(messages, temperature, max_tokens):
+        events.append("gemini")
+        return [{"question": "From Gemini"}]
+
+    async def fake_sleep(seconds):
+        events.append(f"sleep {seconds}")
+
+    monkeypatch.setattr(gateway, "_try_gemini_json_response", fake_gemini)
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+    yield gateway
+    get_settings.cache_clear()
+
+
+async def generate_questions(gateway: OpenAIGateway) -> list:
+    return await gateway.generate_interview_questions("resume", "job", [])
+
+
+class TestInterviewRateLimitRetry:
+    """Test cases for rate-limit retries on interview question generation."""
+
+    async def test_retries_then_succeeds(self, gateway, events):
+        """Test that a transient rate limit is retried with backoff."""
+        gateway.client = FakeClient(events, rate_limited_calls=2)
+
+        questions = await generate_questions(gateway)
+
+        assert questions == [{"question": "Why us?"}]
+        assert events == ["openai", "sleep 1", "openai", "sleep 2", "openai"]
+
+    async def test_sustained_rate_limit_falls_back_to_gemini(self, gateway, events):
+        """Test that attempts are bounded and Gemini is tried after the last one."""
+        gateway.client = FakeClient(events, rate_limited_calls=10)
+
+        questions = await generate_questions(gateway)
+
+        assert questions == [{"question": "From Gemini"}]
+        assert events == ["openai", "sleep 1", "openai", "sleep 2", "openai", "gemini"]
+
+    async def test_sdk_retries_are_disabled_while_retrying(self, gateway, events):
+        """Test that each attempt is a single request (no SDK retries underneath)."""
+        client = FakeClient(events, rate_limited_calls=0)
+        gateway.client = client
+
+        await generate_questions(gateway)
+
+        assert client.options == [{"max_retries": 0}]
+
+
+class TestOtherCallsDoNotRetry:
+    """Test cases for calls outside interview question generation."""
+
+    async def test_rate_limit_goes_straight_to_gemini(self, gateway, events):
+        """Test that other JSON calls make one attempt before the Gemini fallback."""
+        client = FakeClient(events, rate_limited_calls=10)
+        gateway.client = client
+
+        result = await gateway._chat_json("system", "user")
+
+        assert result == [{"question": "From Gemini"}]
+        assert events == ["openai", "gemini"]
+        assert client.options == []
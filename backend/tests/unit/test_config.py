@@ -0,0 +1,27 @@
+"""Unit tests for application settings."""
+
+from src.config import Settings
+
+
+class TestAllowedLists:
+    """Test cases for the parsed allowed origins/extensions."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.settings = Settings(
+            allowed_origins="http://a.test, http://b.test",
+            allowed_extensions=".pdf, .txt",
+        )
+
+    def test_cached_values_are_parsed(self):
+        """Test that comma-separated values are split and stripped."""
+        assert self.settings.allowed_origins_list == ("http://a.test", "http://b.test")
+        assert self.settings.allowed_extensions_list == (".pdf", ".txt")
+
+    def test_legacy_getters_return_fresh_lists(self):
+        """Test that the get_*_list methods still return mutable lists."""
+        origins = self.settings.get_allowed_origins_list()
+        origins.append("http://c.test")
+
+        assert self.settings.get_allowed_origins_list() == ["http://a.test", "http://b.test"]
+        assert self.settings.get_allowed_extensions_list() == [".pdf", ".txt"]